@@ -7,6 +7,7 @@ while maintaining compatibility with the existing action resolution logic.
 
 import random
 import math
+from bisect import bisect_right
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 from combat.interfaces import (
@@ -26,7 +27,11 @@ from combat.lib.action_system import (
 )
 from combat.lib.actions_library import ACTIONS
 
-@dataclass
+# Library actions ordered by stamina cost, so the affordable ones form a prefix
+_ACTIONS_BY_COST = sorted(ACTIONS.items(), key=lambda item: item[1]["stamina_cost"])
+_ACTION_COSTS = [properties["stamina_cost"] for _, properties in _ACTIONS_BY_COST]
+
+@dataclass(slots=True)
 class ActionResult:
     """Result of an action execution."""
     success: bool
@@ -41,8 +46,14 @@ class ActionResolverAdapter(IActionResolver):
     compatibility with existing action resolution logic, with enhanced combat mechanics.
     """
     
-    def __init__(self):
-        """Initialize the action resolver adapter."""
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize the action resolver adapter.
+        
+        Args:
+            seed: Optional seed for damage rolls, for reproducible resolution
+        """
+        self._rng = random.Random(seed)
         self._timing_manager: ITimingManager = TimingSystem()
         self._awareness_manager: IAwarenessManager = AwarenessSystem()
     
@@ -57,7 +68,13 @@ class ActionResolverAdapter(IActionResolver):
             
         Returns:
             ActionResult containing the outcome of the action
+            
+        Raises:
+            ValueError: If action is None (skipped under python -O)
         """
+        if __debug__ and action is None:
+            raise ValueError("Action cannot be None")
+            
         if action.action_type == "release_attack":
             return self._resolve_attack(action, source_state, target_state)
         elif action.action_type.startswith("block"):
@@ -81,7 +98,8 @@ class ActionResolverAdapter(IActionResolver):
             bool indicating if the action is valid
         """
         # Check if action exists
-        if action.type not in ACTIONS:
+        action_props = ACTIONS.get(action.type)
+        if action_props is None:
             return False
             
         # Get actor state
@@ -96,12 +114,8 @@ class ActionResolverAdapter(IActionResolver):
             return False
             
         # Check speed requirements
-        action_props = ACTIONS[action.type]
-        if "speed_requirement" in action_props:
-            if actor_state.speed < action_props["speed_requirement"]:
-                return False
-                
-        return True
+        return ("speed_requirement" not in action_props or
+                actor_state.speed >= action_props["speed_requirement"])
 
     def get_available_actions(self, actor: ICombatant) -> List[Action]:
         """
@@ -116,18 +130,42 @@ class ActionResolverAdapter(IActionResolver):
         available = []
         actor_state = actor.get_state()
         
-        for action_type, properties in ACTIONS.items():
-            if actor_state.stamina >= properties["stamina_cost"]:
-                action = Action(
-                    type=action_type,
-                    time=properties["time"],
-                    stamina_cost=properties["stamina_cost"],
-                    source_id=actor_state.entity_id
-                )
-                available.append(action)
+        affordable = bisect_right(_ACTION_COSTS, actor_state.stamina)
+        for action_type, properties in _ACTIONS_BY_COST[:affordable]:
+            action = Action(
+                type=action_type,
+                time=properties["time"],
+                stamina_cost=properties["stamina_cost"],
+                source_id=actor_state.entity_id
+            )
+            available.append(action)
                 
         return available
 
+    def roll_damage(self, low: int, high: int) -> int:
+        """
+        Roll damage uniformly from [low, high] using the resolver's RNG.
+        
+        Args:
+            low: Smallest possible damage
+            high: Largest possible damage
+            
+        Returns:
+            The rolled damage
+            
+        Raises:
+            ValueError: If high is below low, as random.randint would
+        """
+        span = high - low + 1
+        if span < 1:
+            raise ValueError(f"Empty damage range [{low}, {high}]")
+        if span <= 1 << 16:
+            # Scale 32 random bits onto the range by multiply-shift, skipping
+            # randint's rejection loop; bias is below 2**-16 per value
+            return low + ((self._rng.getrandbits(32) * span) >> 32)
+        # Wide ranges need randrange to keep every value reachable
+        return low + self._rng.randrange(span)
+
     def _resolve_attack(self, action: ActionState, source_state: Any, target_state: Optional[Any]) -> ActionResult:
         """Resolve attack action."""
         if not target_state:
@@ -156,7 +194,7 @@ class ActionResolverAdapter(IActionResolver):
 
     def _resolve_blocked_attack(self, actor_state: 'CombatantState', target_state: 'CombatantState') -> ActionResult:
         """Resolve an attack against a blocking target."""
-        damage = random.randint(
+        damage = self.roll_damage(
             actor_state.attack_power * actor_state.accuracy // 100,
             actor_state.attack_power
         )
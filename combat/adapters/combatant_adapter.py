@@ -5,6 +5,8 @@ This module provides an adapter that makes the existing Combatant class
 compatible with the new ICombatant interface, including enhanced combat mechanics.
 """
 
+from math import hypot
+from operator import attrgetter
 from typing import Optional, Tuple
 from combat.interfaces import (
     ICombatant,
@@ -17,6 +19,12 @@ from combat.lib.timing import TimingSystem
 from combat.lib.awareness_system import AwarenessSystem, AwarenessZone
 from combat.combatant import Combatant
 
+# Core Combatant attributes read by get_state, fetched in a single call
+_CORE_ATTRIBUTES = attrgetter(
+    'combatant_id', 'health', 'max_health', 'stamina', 'max_stamina',
+    'position', 'facing', 'blocking_power', 'action', 'team'
+)
+
 class CombatantAdapter(ICombatant):
     """
     Adapter class that makes the existing Combatant class compatible with ICombatant.
@@ -43,9 +51,12 @@ class CombatantAdapter(ICombatant):
         Returns:
             CombatantState object representing current combatant state
         """
+        (combatant_id, health, max_health, stamina, max_stamina,
+         position, facing, blocking_power, action, team) = _CORE_ATTRIBUTES(self._adaptee)
+        
         # Parse position into x,y coordinates
         try:
-            x, y = map(float, self._adaptee.position.split(','))
+            x, y = map(float, position.split(','))
         except (ValueError, AttributeError):
             x, y = 0.0, 0.0
 
@@ -53,19 +64,19 @@ class CombatantAdapter(ICombatant):
         movement = 0.0
         if hasattr(self._adaptee, 'previous_position'):
             prev_x, prev_y = map(float, self._adaptee.previous_position.split(','))
-            movement = ((x - prev_x) ** 2 + (y - prev_y) ** 2) ** 0.5
+            movement = hypot(x - prev_x, y - prev_y)
 
         return CombatantState(
-            entity_id=str(self._adaptee.combatant_id),
-            health=self._adaptee.health,
-            max_health=self._adaptee.max_health,
-            stamina=self._adaptee.stamina,
-            max_stamina=self._adaptee.max_stamina,
-            position=self._adaptee.position,
-            facing=self._adaptee.facing,
-            blocking_power=self._adaptee.blocking_power,
-            action=self._adaptee.action,
-            team=self._adaptee.team,
+            entity_id=str(combatant_id),
+            health=health,
+            max_health=max_health,
+            stamina=stamina,
+            max_stamina=max_stamina,
+            position=position,
+            facing=facing,
+            blocking_power=blocking_power,
+            action=action,
+            team=team,
             # New fields
             speed=getattr(self._adaptee, 'speed', 1.0),
             stealth=getattr(self._adaptee, 'stealth', 1.0),
@@ -127,26 +138,21 @@ class CombatantAdapter(ICombatant):
         from combat.lib.actions_library import ACTIONS
         
         # Check if action exists in actions library
-        if action.type not in ACTIONS:
+        action_props = ACTIONS.get(action.type)
+        if action_props is None:
             return False
             
         # Get current state
         state = self.get_state()
             
-        # Check stamina requirements
-        total_stamina_cost = ACTIONS[action.type]["stamina_cost"]
+        total_stamina_cost = action_props["stamina_cost"]
         if action.state == ActionState.FEINT:
             total_stamina_cost += action.feint_cost
             
-        if state.stamina < total_stamina_cost:
-            return False
-            
-        # Check speed requirements
-        if "speed_requirement" in ACTIONS[action.type]:
-            if state.speed < ACTIONS[action.type]["speed_requirement"]:
-                return False
-                
-        return True
+        # Stamina and speed requirements
+        return (state.stamina >= total_stamina_cost and
+                ("speed_requirement" not in action_props or
+                 state.speed >= action_props["speed_requirement"]))
 
     def is_within_range(self, distance: float) -> bool:
         """
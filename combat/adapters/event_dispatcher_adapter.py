@@ -2,9 +2,21 @@
 Event dispatcher adapter implementation.
 """
 
-from typing import Dict, List, Optional, Any, Callable
+from bisect import insort
+from typing import Dict, Iterable, List, Optional, Any, Callable
 from dataclasses import dataclass
-from combat.interfaces import IEventDispatcher, CombatEvent
+from combat.interfaces import IEventDispatcher, CombatEvent, EventCategory
+
+def _timestamp(event: Any) -> Any:
+    """Sort key for stream events; events without a timestamp sort first."""
+    return getattr(event, 'timestamp', 0)
+
+# Category subscription names ("combat", "movement", ...) mapped to their slot in
+# the category handler table. Events are routed by category name, so categories
+# from combat.lib.event_system.EventCategory reach the same slots.
+_CATEGORY_SLOTS: Dict[str, int] = {
+    category.name.lower(): slot for slot, category in enumerate(EventCategory)
+}
 
 @dataclass
 class EventStream:
@@ -22,6 +34,7 @@ class EventDispatcherAdapter(IEventDispatcher):
     def __init__(self):
         """Initialize event dispatcher."""
         self._subscribers: Dict[str, List[Callable]] = {}
+        self._category_handlers: List[List[Callable]] = [[] for _ in EventCategory]
         self._event_streams: Dict[str, List[CombatEvent]] = {}
         
     def dispatch(self, event: CombatEvent) -> None:
@@ -30,27 +43,38 @@ class EventDispatcherAdapter(IEventDispatcher):
         
         Args:
             event: Event to dispatch
+            
+        Raises:
+            ValueError: If event is None (skipped under python -O)
         """
+        if __debug__ and event is None:
+            raise ValueError("Event cannot be None")
+            
         # Add to category stream
         stream_key = event.category.name.lower()
         if stream_key not in self._event_streams:
             self._event_streams[stream_key] = []
-        self._event_streams[stream_key].append(event)
+        self._add_to_stream(self._event_streams[stream_key], event)
         
         # Add to specific event type stream
         event_stream_key = event.event_type.lower()
         if event_stream_key not in self._event_streams:
             self._event_streams[event_stream_key] = []
-        self._event_streams[event_stream_key].append(event)
+        self._add_to_stream(self._event_streams[event_stream_key], event)
         
         # Notify subscribers
-        # Handle both specific event type and wildcard subscribers
+        # Handle specific event type, category and wildcard subscribers
         handlers_to_notify = []
         
         # Add specific event type handlers
         if event.event_type in self._subscribers:
             handlers_to_notify.extend(self._subscribers[event.event_type])
             
+        # Add category handlers
+        slot = _CATEGORY_SLOTS.get(event.category.name.lower())
+        if slot is not None:
+            handlers_to_notify.extend(self._category_handlers[slot])
+            
         # Add wildcard handlers
         if "*" in self._subscribers:
             handlers_to_notify.extend(self._subscribers["*"])
@@ -59,14 +83,33 @@ class EventDispatcherAdapter(IEventDispatcher):
         for handler in handlers_to_notify:
             handler(event)
                 
+    def dispatch_batch(self, events: Iterable[CombatEvent]) -> None:
+        """
+        Dispatch several events in order.
+        
+        Args:
+            events: Events to dispatch
+        """
+        dispatch = self.dispatch
+        for event in events:
+            dispatch(event)
+            
     def subscribe(self, event_type: str, handler: Callable) -> None:
         """
         Subscribe to events.
         
+        Subscribing to a category name (e.g. "combat") receives every
+        event in that category.
+        
         Args:
-            event_type: Type of events to subscribe to
+            event_type: Type or category of events to subscribe to
             handler: Event handler function
         """
+        slot = _CATEGORY_SLOTS.get(event_type)
+        if slot is not None:
+            self._category_handlers[slot].append(handler)
+            return
+            
         if event_type not in self._subscribers:
             self._subscribers[event_type] = []
         self._subscribers[event_type].append(handler)
@@ -76,9 +119,14 @@ class EventDispatcherAdapter(IEventDispatcher):
         Unsubscribe from events.
         
         Args:
-            event_type: Event type to unsubscribe from
+            event_type: Event type or category to unsubscribe from
             handler: Handler to remove
         """
+        slot = _CATEGORY_SLOTS.get(event_type)
+        if slot is not None:
+            self._category_handlers[slot].remove(handler)
+            return
+            
         if event_type in self._subscribers:
             self._subscribers[event_type].remove(handler)
             if not self._subscribers[event_type]:
@@ -96,12 +144,22 @@ class EventDispatcherAdapter(IEventDispatcher):
         """
         # Convert to lowercase for case-insensitive matching
         stream_key = stream_name.lower()
-        events = self._event_streams.get(stream_key, [])
         
-        # Sort events by timestamp if they have one
-        sorted_events = sorted(
-            events,
-            key=lambda e: getattr(e, 'timestamp', 0)
-        )
+        # Streams are kept in timestamp order as events arrive
+        return EventStream(list(self._event_streams.get(stream_key, ())))
         
-        return EventStream(sorted_events)
+    @staticmethod
+    def _add_to_stream(stream: List[CombatEvent], event: CombatEvent) -> None:
+        """
+        Add an event to a stream, keeping it ordered by timestamp.
+        
+        Events with equal timestamps keep their dispatch order.
+        
+        Args:
+            stream: Stream to add the event to
+            event: Event to add
+        """
+        if not stream or _timestamp(stream[-1]) <= _timestamp(event):
+            stream.append(event)
+        else:
+            insort(stream, event, key=_timestamp)
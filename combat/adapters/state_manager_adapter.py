@@ -5,7 +5,8 @@ This module provides an adapter that implements the IStateManager interface
 while maintaining compatibility with the existing state management logic.
 """
 
-from typing import Any, Dict, Optional, Tuple
+from collections import deque
+from typing import Any, Dict, Iterable, Optional, Tuple
 from dataclasses import replace
 from combat.interfaces import (
     IStateManager,
@@ -32,10 +33,13 @@ class StateManagerAdapter(IStateManager):
     compatibility with existing state management.
     """
     
+    # Maximum number of historical states kept per entity
+    MAX_HISTORY = 1000
+    
     def __init__(self):
         """Initialize the state manager."""
         self._states: Dict[str, Any] = {}
-        self._state_history: Dict[str, list] = {}
+        self._state_history: Dict[str, deque] = {}
         self._timing_manager: ITimingManager = TimingSystem()
         self._awareness_manager: IAwarenessManager = AwarenessSystem()
         self._transition_rules = {
@@ -67,8 +71,12 @@ class StateManagerAdapter(IStateManager):
             new_state: The new state to apply
             
         Raises:
+            ValueError: If new_state is None (skipped under python -O)
             StateTransitionError: If the state transition is invalid
         """
+        if __debug__ and new_state is None:
+            raise ValueError("State cannot be None")
+            
         current_state = self._states.get(entity_id)
         
         # Validate state transition if current state exists
@@ -78,14 +86,40 @@ class StateManagerAdapter(IStateManager):
                     f"Invalid state transition for entity {entity_id}"
                 )
             
-            # Store in history
-            if entity_id not in self._state_history:
-                self._state_history[entity_id] = []
-            self._state_history[entity_id].append(current_state)
+            # A distinct but equal state is a no-op; the stored object passed
+            # back (possibly mutated in place) is still recorded
+            if new_state is not current_state and new_state == current_state:
+                return
+            
+            # Store in history, dropping the oldest state once full
+            history = self._state_history.get(entity_id)
+            if history is None:
+                history = self._state_history[entity_id] = deque(maxlen=self.MAX_HISTORY)
+            history.append(current_state)
             
         # Update state
         self._states[entity_id] = new_state
 
+    def update_state_batch(self, states: Iterable[Any]) -> None:
+        """
+        Apply a batch of state updates, keeping only the last state per entity.
+        
+        Intermediate states for the same entity are neither validated nor
+        recorded in history; each entity gets a single update.
+        
+        Args:
+            states: States to apply, keyed by their entity_id
+            
+        Raises:
+            StateTransitionError: If a final state transition is invalid
+        """
+        latest: Dict[str, Any] = {}
+        for state in states:
+            latest[state.entity_id] = state
+            
+        for entity_id, state in latest.items():
+            self.update_state(entity_id, state)
+
     def validate_state_transition(self, current_state: Any, new_state: Any) -> bool:
         """
         Validate if a state transition is valid.
@@ -227,12 +261,12 @@ class StateManagerAdapter(IStateManager):
             limit: Optional limit on number of historical states to return
             
         Returns:
-            List of historical states
+            List of historical states (at most MAX_HISTORY)
         """
-        history = self._state_history.get(entity_id, [])
+        history = list(self._state_history.get(entity_id, ()))
         if limit:
             return history[-limit:]
-        return history.copy()
+        return history
 
     def rollback_state(self, entity_id: str) -> bool:
         """
@@ -244,7 +278,7 @@ class StateManagerAdapter(IStateManager):
         Returns:
             bool indicating if rollback was successful
         """
-        history = self._state_history.get(entity_id, [])
+        history = self._state_history.get(entity_id)
         if not history:
             return False
             
@@ -260,4 +294,4 @@ class StateManagerAdapter(IStateManager):
             entity_id: The ID of the entity
         """
         if entity_id in self._state_history:
-            self._state_history[entity_id] = []
+            self._state_history[entity_id].clear()
@@ -5,9 +5,11 @@ This module implements the core combat system using the new interface-based arch
 while maintaining backward compatibility with existing code.
 """
 
+import heapq
+import itertools
 import random
 from datetime import datetime
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from combat.lib.actions_library import ACTIONS
 from combat.interfaces import (
     ICombatant,
@@ -36,7 +38,8 @@ from combat.adapters import (
 class CombatSystem:
     """Core combat system implementation."""
     
-    def __init__(self, duration: int, distance: float, max_distance: float):
+    def __init__(self, duration: int, distance: float, max_distance: float,
+                 seed: Optional[int] = None):
         """
         Initialize the combat system.
         
@@ -44,16 +47,18 @@ class CombatSystem:
             duration: Maximum battle duration in milliseconds
             distance: Initial distance between combatants
             max_distance: Maximum allowed distance
+            seed: Optional seed for combat resolution randomness
         """
         self.timer = 0
         self.duration = duration
         self.distance = distance
         self.max_distance = max_distance
         self.event_counter = 0
+        self._event_ids = itertools.count(1)
         
         # Initialize systems and adapters
         self._action_system = ActionSystem()
-        self._action_resolver = ActionResolverAdapter()
+        self._action_resolver = ActionResolverAdapter(seed=seed)
         self._state_manager = StateManagerAdapter()
         self._event_dispatcher = EventDispatcherAdapter()
         self._awareness_system = AwarenessSystemAdapter()
@@ -63,11 +68,39 @@ class CombatSystem:
         self._actions: Dict[str, ActionState] = {}
         self.next_event = None
         
+        # Released actions as a min-heap of (recovery_time, sequence, action_id)
+        self._recovery_queue: List[Tuple[float, int, str]] = []
+        self._recovery_sequence = itertools.count()
+        
         # Subscribe to events
         self._event_dispatcher.subscribe("action_completed", self._handle_action_completed)
         self._event_dispatcher.subscribe("state_changed", self._handle_state_changed)
         self._event_dispatcher.subscribe("combat", self._handle_combat_event)
         
+    @classmethod
+    def from_combatants(cls, combatants: List, duration: int, distance: float,
+                        max_distance: float, seed: Optional[int] = None) -> "CombatSystem":
+        """
+        Create a combat system with its combatants already added.
+        
+        Args:
+            combatants: Combatants to add, challenger first
+            duration: Maximum battle duration in milliseconds
+            distance: Initial distance between combatants
+            max_distance: Maximum allowed distance
+            seed: Optional seed for combat resolution randomness
+            
+        Returns:
+            The populated combat system
+            
+        Raises:
+            ValueError: If a combatant is invalid or the battle is overfilled
+        """
+        battle = cls(duration, distance, max_distance, seed=seed)
+        for combatant in combatants:
+            battle.add_combatant(combatant)
+        return battle
+        
     def _handle_action_completed(self, event: CombatEvent) -> None:
         """Handle action completion events."""
         action_id = event.data.get("action_id")
@@ -208,6 +241,13 @@ class CombatSystem:
             
         # Update action state
         self._action_system.update_action_state(action.action_id, action_to_release)
+        
+        # Schedule the transition to recovery
+        action_duration = ACTIONS.get(action.action_type, {}).get('time', 1000)  # Default 1 second
+        heapq.heappush(
+            self._recovery_queue,
+            (action_duration, next(self._recovery_sequence), action.action_id)
+        )
             
         # Resolve the action
         result = self._action_resolver.resolve_action(action, source_state, target_state)
@@ -288,44 +328,43 @@ class CombatSystem:
         """
         self.timer += delta_time
         
-        # Get all active actions
-        active_actions = {
-            action_id: action 
-            for action_id, action in self._action_system._actions.items()
-            if action.state != ActionStateType.RECOVERY
-        }
+        # Events raised in the same tick share one timestamp
+        now = datetime.now()
         
-        # Update each action
-        for action_id, action in active_actions.items():
-            # Get action timing from actions library
-            action_data = ACTIONS.get(action.action_type, {})
-            action_duration = action_data.get('time', 1000)  # Default 1 second
+        # Pop released actions whose recovery time has been reached
+        queue = self._recovery_queue
+        while queue and queue[0][0] <= self.timer:
+            _, _, action_id = heapq.heappop(queue)
+            action = self._action_system.get_action_state(action_id)
             
-            # Check if action should transition to recovery
-            if self.timer >= action_duration:
-                # Create recovery state
-                recovery_state = ActionState(
-                    action_id=action.action_id,
-                    action_type=action.action_type,
-                    source_id=action.source_id,
-                    target_id=action.target_id,
-                    state=ActionStateType.RECOVERY,
-                    visibility=action.visibility,
-                    properties=action.properties
-                )
-                
-                # Update action state
-                self._action_system.update_action_state(action_id, recovery_state)
+            # Skip actions cancelled or moved on since they were scheduled
+            if action is None or action.state != ActionStateType.RELEASE:
+                continue
                 
-                # Dispatch event
-                self._dispatch_event(action.action_type, {
-                    "action_id": action_id,
-                    "source_id": action.source_id,
-                    "target_id": action.target_id,
-                    "state": "recovery"
-                })
+            # Create recovery state
+            recovery_state = ActionState(
+                action_id=action.action_id,
+                action_type=action.action_type,
+                source_id=action.source_id,
+                target_id=action.target_id,
+                state=ActionStateType.RECOVERY,
+                visibility=action.visibility,
+                properties=action.properties
+            )
+            
+            # Update action state
+            self._action_system.update_action_state(action_id, recovery_state)
+            
+            # Dispatch event
+            self._dispatch_event(action.action_type, {
+                "action_id": action_id,
+                "source_id": action.source_id,
+                "target_id": action.target_id,
+                "state": "recovery"
+            }, timestamp=now)
 
-    def _dispatch_event(self, event_type: str, data: dict, category: EventCategory = EventCategory.COMBAT) -> None:
+    def _dispatch_event(self, event_type: str, data: dict, category: EventCategory = EventCategory.COMBAT,
+                        timestamp: Optional[datetime] = None) -> None:
         """
         Dispatch an event with the given type and data.
         
@@ -333,15 +372,16 @@ class CombatSystem:
             event_type: Type of event
             data: Event data
             category: Event category (defaults to COMBAT)
+            timestamp: Optional event time (defaults to now)
         """
-        # Create unique event ID and use current time
-        self.event_counter += 1
+        # Create unique event ID and use the given or current time
+        self.event_counter = next(self._event_ids)
         event = CombatEvent(
             event_id=f"{event_type}_{self.event_counter}",
             event_type=event_type,
             category=category,
             importance=EventImportance.MAJOR,  # Use MAJOR for standard combat events
-            timestamp=datetime.now(),
+            timestamp=timestamp if timestamp is not None else datetime.now(),
             source_id=data.get("source_id"),
             target_id=data.get("target_id"),
             data=data
@@ -48,9 +48,9 @@ class TestCombatant(Combatant):
     def force_action(self, action_type, timer=0, event_counter=0, distance=0):
         """Force a specific action to occur at a given time."""
         # Deduct stamina cost when forcing an action
-        if action_type in ACTIONS:
-            stamina_cost = ACTIONS[action_type]["stamina_cost"]
-            self.stamina = max(0, self.stamina - stamina_cost)
+        action_props = ACTIONS.get(action_type)
+        if action_props is not None:
+            self.stamina = max(0, self.stamina - action_props["stamina_cost"])
             
         action = self.create_action(action_type, timer)
         self.action = action
@@ -58,7 +58,8 @@ class TestCombatant(Combatant):
 
     def create_action(self, action_type, timer, target=None):
         """Create standardized action dictionary."""
-        if action_type not in ACTIONS:
+        action_props = ACTIONS.get(action_type)
+        if action_props is None:
             raise ValueError(f"Invalid action type: {action_type}")
             
         # For blocking and evading, use current timer to maintain state
@@ -66,7 +67,7 @@ class TestCombatant(Combatant):
             time = timer
         else:
             # For all other actions, add their duration to current timer
-            time = timer + ACTIONS[action_type]["time"]
+            time = timer + action_props["time"]
             
         return {
             "type": action_type,
@@ -21,7 +21,7 @@ class ActionVisibility(Enum):
     TELEGRAPHED = auto()  # Clearly visible
     HIDDEN = auto()       # Stealthy action
 
-@dataclass
+@dataclass(slots=True)
 class ActionState:
     """State information for an action."""
     action_id: str
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Dict, Optional, Protocol, Any, runtime_checkable
 
 
-@dataclass
+@dataclass(slots=True)
 class CombatantState:
     """State information for a combatant."""
     entity_id: str
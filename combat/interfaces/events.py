@@ -27,7 +27,7 @@ class EventImportance(Enum):
     DEBUG = auto()     # Debug information
 
 
-@dataclass
+@dataclass(slots=True)
 class CombatEvent:
     """Base event class for combat system."""
     event_id: str
@@ -40,7 +40,7 @@ class CombatEvent:
     data: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class Action:
     """Action definition."""
     action_type: str
@@ -51,7 +51,7 @@ class Action:
     properties: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionResult:
     """Result of an action execution."""
     success: bool
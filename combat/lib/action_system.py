@@ -12,22 +12,28 @@ from combat.interfaces import (
 
 from combat.lib.actions_library import ACTIONS
 
+# Allowed (current, next) action state pairs
+_VALID_TRANSITIONS = frozenset({
+    # Feints can commit, release or cancel
+    (ActionStateType.FEINT, ActionStateType.COMMIT),
+    (ActionStateType.FEINT, ActionStateType.RELEASE),
+    (ActionStateType.FEINT, ActionStateType.COMPLETE),
+    (ActionStateType.COMMIT, ActionStateType.RELEASE),    # Committed actions must release
+    (ActionStateType.RELEASE, ActionStateType.RECOVERY),  # Released actions go to recovery
+    (ActionStateType.RECOVERY, ActionStateType.COMPLETE), # Recovery leads to completion
+})
+
 class ActionSystem(IActionSystem):
     """Manages action execution and state transitions."""
     
     def __init__(self):
         """Initialize the action system."""
-        self._valid_transitions = {
-            ActionStateType.FEINT: {ActionStateType.RELEASE, ActionStateType.COMPLETE},  # Can release or cancel
-            ActionStateType.RELEASE: {ActionStateType.RECOVERY},  # Released actions go to recovery
-            ActionStateType.RECOVERY: {ActionStateType.COMPLETE},  # Recovery leads to completion
-            ActionStateType.COMPLETE: set()  # Terminal state
-        }
         self._actions: Dict[str, ActionState] = {}
         
-    def validate_transition(self, current: ActionStateType, next_state: ActionStateType) -> bool:
+    @staticmethod
+    def validate_transition(current: ActionStateType, next_state: ActionStateType) -> bool:
         """Validate state transition."""
-        return next_state in self._valid_transitions.get(current, set())
+        return (current, next_state) in _VALID_TRANSITIONS
         
     def calculate_visibility(self, visibility: ActionVisibility, stealth: float, movement: float) -> float:
         """Calculate action visibility level."""
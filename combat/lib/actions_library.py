@@ -5,6 +5,7 @@ This module defines all available combat actions and their properties,
 integrating with the core combat systems.
 """
 
+from functools import lru_cache
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 from combat.lib.action_system import (
@@ -109,6 +110,21 @@ ACTIONS = {
     }
 }
 
+# Availability requirements per action, flattened once at import:
+# (action_type, stamina_cost, speed_requirement, partial_commit_cost,
+#  full_commit_cost, can_be_hidden)
+_AVAILABILITY_TABLE = tuple(
+    (
+        action_type,
+        props["stamina_cost"],
+        props.get("speed_requirement", 0.0),
+        props["stamina_cost"] * 1.2,
+        props["stamina_cost"] * 1.5,
+        props["category"] in ("attack", "movement")
+    )
+    for action_type, props in ACTIONS.items()
+)
+
 def create_action(
     action_type: str,
     source_id: str,
@@ -127,6 +143,27 @@ def create_action(
     Returns:
         New action state
         
+    Raises:
+        ValueError: If action type is invalid
+    """
+    return ActionState(
+        action_id=f"{source_id}_{action_type}",
+        action_type=action_type,
+        source_id=source_id,
+        target_id=target_id,
+        state=ActionStateType.FEINT,
+        visibility=visibility,
+        properties=dict(_action_properties(action_type))
+    )
+
+@lru_cache(maxsize=None)
+def _action_properties(action_type: str) -> Dict:
+    """
+    Build the derived property template for an action type.
+    
+    The returned dict is shared between calls and must be copied before
+    being handed out.
+    
     Raises:
         ValueError: If action type is invalid
     """
@@ -141,20 +178,12 @@ def create_action(
     # Calculate feint cost
     feint_cost = stamina_cost * 0.5 if props["category"] == "attack" else 0
     
-    return ActionState(
-        action_id=f"{source_id}_{action_type}",
-        action_type=action_type,
-        source_id=source_id,
-        target_id=target_id,
-        state=ActionStateType.FEINT,
-        visibility=visibility,
-        properties={
-            "stamina_cost": stamina_cost,
-            "feint_cost": feint_cost,
-            "speed_requirement": props.get("speed_requirement", 0.0),
-            **props["properties"]
-        }
-    )
+    return {
+        "stamina_cost": stamina_cost,
+        "feint_cost": feint_cost,
+        "speed_requirement": props.get("speed_requirement", 0.0),
+        **props["properties"]
+    }
 
 def determine_action_visibility(action_type: str) -> ActionVisibility:
     """Get visibility for action type based on its properties."""
@@ -180,29 +209,41 @@ def validate_action_chain(actions: List[ActionState]) -> bool:
     Returns:
         Whether chain is valid
     """
-    if not actions:
-        return True
+    return _validate_type_chain(tuple(action.action_type for action in actions))
+
+@lru_cache(maxsize=1024)
+def _validate_type_chain(action_types: tuple) -> bool:
+    """Validate a chain of action types; the chain rules only depend on type."""
+    # Pairs involving a type outside ACTIONS are never valid
+    return all(
+        _CHAIN_TRANSITIONS.get(step, False)
+        for step in zip(action_types, action_types[1:])
+    )
+
+def _can_follow(current: str, next_action: str) -> bool:
+    """Check whether one action type may directly follow another."""
+    # Can't chain certain categories
+    if current == next_action:
+        return False
+        
+    # Movement restrictions
+    if current == "move_backward" and next_action == "move_forward":
+        return False
+        
+    # Attack restrictions
+    if (ACTIONS[current]["category"] == "attack" and
+        ACTIONS[next_action]["category"] == "attack"):
+        return False
         
-    for i in range(len(actions) - 1):
-        current = actions[i]
-        next_action = actions[i + 1]
-                    
-        # Can't chain certain categories
-        if current.action_type == next_action.action_type:
-            return False
-            
-        # Movement restrictions
-        if (current.action_type == "move_backward" and
-            next_action.action_type == "move_forward"):
-            return False
-            
-        # Attack restrictions
-        if (ACTIONS[current.action_type]["category"] == "attack" and
-            ACTIONS[next_action.action_type]["category"] == "attack"):
-            return False
-            
     return True
 
+# Whether each (current, next) action type pair may be chained
+_CHAIN_TRANSITIONS: Dict[tuple, bool] = {
+    (current, next_action): _can_follow(current, next_action)
+    for current in ACTIONS
+    for next_action in ACTIONS
+}
+
 def get_available_actions(state: 'CombatantState') -> List[ActionState]:
     """
     Get list of available actions for a combatant.
@@ -213,44 +254,36 @@ def get_available_actions(state: 'CombatantState') -> List[ActionState]:
     Returns:
         List of available actions
     """
-    available = []
+    return [
+        create_action(action_type, state.entity_id, visibility=visibility)
+        for action_type, visibility in _available_variants(
+            state.stamina, state.speed, state.stealth
+        )
+    ]
+
+@lru_cache(maxsize=1024)
+def _available_variants(stamina: float, speed: float, stealth: float) -> tuple:
+    """Get the (action_type, visibility) variants available for the given stats."""
+    variants = []
     
-    for action_type, props in ACTIONS.items():
-        # Check stamina cost
-        if state.stamina < props["stamina_cost"]:
+    for (action_type, stamina_cost, speed_requirement,
+         partial_cost, full_cost, hideable) in _AVAILABILITY_TABLE:
+        # Check stamina cost and speed requirement
+        if stamina < stamina_cost or speed < speed_requirement:
             continue
-            
-        # Check speed requirement
-        if "speed_requirement" in props:
-            if state.speed < props["speed_requirement"]:
-                continue
                 
         # Add basic version
-        available.append(create_action(
-            action_type,
-            state.entity_id
-        ))
+        variants.append((action_type, ActionVisibility.TELEGRAPHED))
         
         # Add committed versions if enough stamina
-        if state.stamina >= props["stamina_cost"] * 1.2:
-            available.append(create_action(
-                action_type,
-                state.entity_id,
-            ))
+        if stamina >= partial_cost:
+            variants.append((action_type, ActionVisibility.TELEGRAPHED))
             
-        if state.stamina >= props["stamina_cost"] * 1.5:
-            available.append(create_action(
-                action_type,
-                state.entity_id,
-            ))
+        if stamina >= full_cost:
+            variants.append((action_type, ActionVisibility.TELEGRAPHED))
             
         # Add hidden version for applicable actions
-        if props["category"] in ["attack", "movement"]:
-            if state.stealth >= 1.0:
-                available.append(create_action(
-                    action_type,
-                    state.entity_id,
-                    visibility=ActionVisibility.HIDDEN
-                ))
+        if hideable and stealth >= 1.0:
+            variants.append((action_type, ActionVisibility.HIDDEN))
                 
-    return available
+    return tuple(variants)
@@ -5,10 +5,10 @@ This module implements awareness zones and perception mechanics
 for the combat system.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Dict, Optional, Tuple, Any
-from math import sqrt, cos, radians
+from functools import lru_cache
+from typing import Dict, Optional, Set, Tuple, Any
 
 class AwarenessZone(Enum):
     """Zones of awareness around a combatant."""
@@ -27,7 +27,25 @@ class PerceptionModifier(Enum):
     STEALTH = "stealth"          # Target stealth rating
     DISTRACTION = "distraction"   # Environmental distractions
 
-@dataclass
+# Position of each modifier in AwarenessState.modifiers
+_MODIFIER_SLOTS: Dict[PerceptionModifier, int] = {
+    modifier: slot for slot, modifier in enumerate(PerceptionModifier)
+}
+
+# Order in which update_awareness writes its modifier tuple
+_MODIFIER_ORDER = (
+    PerceptionModifier.DISTANCE,
+    PerceptionModifier.ANGLE,
+    PerceptionModifier.LIGHTING,
+    PerceptionModifier.COVER,
+    PerceptionModifier.MOVEMENT,
+    PerceptionModifier.STEALTH,
+    PerceptionModifier.DISTRACTION,
+)
+assert _MODIFIER_ORDER == tuple(_MODIFIER_SLOTS), \
+    "update_awareness modifier order is out of sync with PerceptionModifier"
+
+@dataclass(frozen=True, slots=True)
 class EnvironmentConditions:
     """Environmental conditions affecting awareness."""
     lighting_level: float = 1.0  # 0.0 (dark) to 1.0 (bright)
@@ -35,14 +53,28 @@ class EnvironmentConditions:
     distraction_level: float = 0.0  # 0.0 (calm) to 1.0 (chaotic)
     visibility_range: float = 100.0  # Maximum visibility distance
 
-@dataclass
+@dataclass(slots=True)
 class AwarenessState:
     """Current awareness state of a combatant."""
     zone: AwarenessZone
     confidence: float  # 0.0 to 1.0
     last_clear_position: Optional[Tuple[float, float]] = None
     last_update_time: float = 0.0
-    modifiers: Dict[PerceptionModifier, float] = field(default_factory=dict)
+    modifiers: Tuple[float, ...] = ()  # Values in PerceptionModifier order
+    
+    def modifier(self, kind: PerceptionModifier) -> float:
+        """
+        Get the value of a perception modifier.
+        
+        Args:
+            kind: Modifier to look up
+            
+        Returns:
+            Modifier value, or 0.0 if modifiers have not been computed
+        """
+        if not self.modifiers:
+            return 0.0
+        return self.modifiers[_MODIFIER_SLOTS[kind]]
 
 class PerceptionCheck:
     """Handles perception checks and calculations."""
@@ -111,6 +143,28 @@ class PerceptionCheck:
         Returns:
             Confidence value (0.0 to 1.0)
         """
+        return PerceptionCheck._confidence(
+            perception,
+            stealth,
+            distance,
+            angle,
+            conditions.lighting_level,
+            conditions.cover_density,
+            conditions.distraction_level
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _confidence(
+        perception: float,
+        stealth: float,
+        distance: float,
+        angle: float,
+        lighting_level: float,
+        cover_density: float,
+        distraction_level: float
+    ) -> float:
+        """Compute detection confidence, memoised on the exact inputs."""
         # Base detection chance
         base_confidence = max(0.0, min(1.0, perception / (stealth + 1.0)))
         
@@ -125,9 +179,9 @@ class PerceptionCheck:
         
         # Apply environmental modifiers
         env_mod = (
-            (1.0 - conditions.cover_density) *
-            conditions.lighting_level *
-            (1.0 - conditions.distraction_level)
+            (1.0 - cover_density) *
+            lighting_level *
+            (1.0 - distraction_level)
         )
         
         # Calculate final confidence
@@ -150,7 +204,8 @@ class AwarenessSystem:
             conditions: Environmental conditions
         """
         self._conditions = conditions or EnvironmentConditions()
-        self._awareness_states: Dict[str, Dict[str, AwarenessState]] = {}
+        self._awareness_states: Dict[Tuple[str, str], AwarenessState] = {}
+        self._targets_by_observer: Dict[str, Set[str]] = {}
         
     def register_combatant(self, combatant_id: str) -> None:
         """
@@ -159,8 +214,8 @@ class AwarenessSystem:
         Args:
             combatant_id: Unique combatant identifier
         """
-        if combatant_id not in self._awareness_states:
-            self._awareness_states[combatant_id] = {}
+        if combatant_id not in self._targets_by_observer:
+            self._targets_by_observer[combatant_id] = set()
             
     def update_awareness(self,
                         observer_id: str,
@@ -185,16 +240,15 @@ class AwarenessSystem:
         Returns:
             Updated awareness state
         """
-        if observer_id not in self._awareness_states:
+        key = (observer_id, target_id)
+        state = self._awareness_states.get(key)
+        if state is None:
             self.register_combatant(observer_id)
-            
-        if target_id not in self._awareness_states[observer_id]:
-            self._awareness_states[observer_id][target_id] = AwarenessState(
+            self._targets_by_observer[observer_id].add(target_id)
+            state = self._awareness_states[key] = AwarenessState(
                 zone=AwarenessZone.HIDDEN,
                 confidence=0.0
             )
-            
-        state = self._awareness_states[observer_id][target_id]
         
         # Calculate new confidence
         confidence = PerceptionCheck.calculate_confidence(
@@ -205,16 +259,16 @@ class AwarenessSystem:
             self._conditions
         )
         
-        # Update modifiers
-        state.modifiers = {
-            PerceptionModifier.DISTANCE: distance / self._conditions.visibility_range,
-            PerceptionModifier.ANGLE: angle / 180.0,
-            PerceptionModifier.LIGHTING: self._conditions.lighting_level,
-            PerceptionModifier.COVER: self._conditions.cover_density,
-            PerceptionModifier.MOVEMENT: target_stats.get("movement", 0.0),
-            PerceptionModifier.STEALTH: target_stats.get("stealth", 1.0),
-            PerceptionModifier.DISTRACTION: self._conditions.distraction_level
-        }
+        # Update modifiers, laid out in _MODIFIER_ORDER
+        state.modifiers = (
+            distance / self._conditions.visibility_range,  # DISTANCE
+            angle / 180.0,                                 # ANGLE
+            self._conditions.lighting_level,               # LIGHTING
+            self._conditions.cover_density,                # COVER
+            target_stats.get("movement", 0.0),             # MOVEMENT
+            target_stats.get("stealth", 1.0),              # STEALTH
+            self._conditions.distraction_level             # DISTRACTION
+        )
         
         # Determine awareness zone
         if confidence >= 0.8:
@@ -248,9 +302,7 @@ class AwarenessSystem:
         Returns:
             Current awareness state or None if not found
         """
-        return (
-            self._awareness_states.get(observer_id, {}).get(target_id)
-        )
+        return self._awareness_states.get((observer_id, target_id))
         
     def clear_awareness(self, combatant_id: str) -> None:
         """
@@ -260,13 +312,14 @@ class AwarenessSystem:
             combatant_id: Combatant identifier
         """
         # Clear as observer
-        if combatant_id in self._awareness_states:
-            del self._awareness_states[combatant_id]
+        for target_id in self._targets_by_observer.pop(combatant_id, ()):
+            del self._awareness_states[(combatant_id, target_id)]
             
         # Clear as target
-        for observer_states in self._awareness_states.values():
-            if combatant_id in observer_states:
-                del observer_states[combatant_id]
+        for observer_id, targets in self._targets_by_observer.items():
+            if combatant_id in targets:
+                targets.discard(combatant_id)
+                del self._awareness_states[(observer_id, combatant_id)]
                 
     def update_conditions(self, conditions: EnvironmentConditions) -> None:
         """
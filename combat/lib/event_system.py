@@ -7,7 +7,7 @@ streaming, compression, and importance-based filtering.
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Dict, List, Optional, Set, Any, Callable
+from typing import Dict, Iterable, List, Optional, Set, Any, Callable
 from datetime import datetime
 import json
 import zlib
@@ -30,7 +30,7 @@ class EventImportance(Enum):
     MINOR = 2     # Regular updates
     DEBUG = 1     # Debug information
 
-@dataclass
+@dataclass(slots=True)
 class EnhancedEvent:
     """Enhanced event with categorization and compression."""
     event_id: str
@@ -140,6 +140,9 @@ class EventManager:
     def __init__(self):
         """Initialize with default streams."""
         self._streams: Dict[str, EventStream] = {}
+        self._streams_by_category: Dict[EventCategory, List[EventStream]] = {
+            category: [] for category in EventCategory
+        }
         self._handlers: Dict[str, List[Callable[[EnhancedEvent], None]]] = {}
         
         # Create default streams
@@ -176,6 +179,9 @@ class EventManager:
         """
         Create new event stream.
         
+        Routing follows the categories given here; categories outside
+        EventCategory are accepted and get their own routing entry.
+        
         Args:
             name: Stream identifier
             categories: Event categories to include
@@ -188,12 +194,17 @@ class EventManager:
         if name in self._streams:
             raise ValueError(f"Stream {name} already exists")
             
-        self._streams[name] = EventStream(
+        stream = EventStream(
             name=name,
             categories=categories,
             importance_threshold=importance_threshold,
             max_size=max_size
         )
+        self._streams[name] = stream
+        
+        # Route each category straight to the streams that accept it
+        for category in categories:
+            self._streams_by_category.setdefault(category, []).append(stream)
         
     def dispatch_event(self, event: EnhancedEvent) -> None:
         """
@@ -202,17 +213,29 @@ class EventManager:
         Args:
             event: Event to dispatch
         """
-        # Route to streams
-        for stream in self._streams.values():
+        # Route to streams that accept the event's category; categories
+        # outside EventCategory have no streams and are skipped
+        for stream in self._streams_by_category.get(event.category, ()):
             stream.add_event(event)
             
         # Notify handlers
-        for handler in self._handlers.get(event.event_type, []):
+        for handler in self._handlers.get(event.event_type, ()):
             try:
                 handler(event)
             except Exception as e:
                 print(f"Error in event handler: {str(e)}")
                 
+    def dispatch_batch(self, events: Iterable[EnhancedEvent]) -> None:
+        """
+        Dispatch several events in order.
+        
+        Args:
+            events: Events to dispatch
+        """
+        dispatch_event = self.dispatch_event
+        for event in events:
+            dispatch_event(event)
+            
     def subscribe(self, event_type: str, handler: Callable[[EnhancedEvent], None]) -> None:
         """
         Subscribe to events.
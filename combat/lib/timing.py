@@ -5,16 +5,16 @@ This module provides the core timing utilities for the combat system,
 including time conversions, speed modifications, and time modifiers.
 """
 
+import time
 from dataclasses import dataclass
 from typing import Dict, Optional
-from datetime import datetime
 
 @dataclass
 class TimeModifier:
     """Represents a time modification effect."""
     value: float  # Multiplier value
     duration: Optional[int] = None  # Duration in milliseconds
-    start_time: Optional[datetime] = None  # When the modifier was applied
+    start_time: Optional[float] = None  # Monotonic time (s) the modifier was applied
     category: str = "general"  # Category for stacking rules
 
 class TimingSystem:
@@ -23,7 +23,7 @@ class TimingSystem:
     def __init__(self):
         """Initialize the timing system."""
         self._modifiers: Dict[str, TimeModifier] = {}
-        self._last_update = datetime.now()
+        self._last_update = time.monotonic()
         
     def convert_to_btu(self, ms: int) -> float:
         """
@@ -73,7 +73,7 @@ class TimingSystem:
         self._modifiers[source] = TimeModifier(
             value=value,
             duration=duration,
-            start_time=datetime.now() if duration else None,
+            start_time=time.monotonic() if duration else None,
             category=category
         )
         
@@ -84,13 +84,13 @@ class TimingSystem:
         Args:
             elapsed_ms: Elapsed time in milliseconds
         """
-        current_time = datetime.now()
+        current_time = time.monotonic()
         
         # Remove expired modifiers
         expired = []
         for source, modifier in self._modifiers.items():
             if modifier.duration and modifier.start_time:
-                elapsed = (current_time - modifier.start_time).total_seconds() * 1000
+                elapsed = (current_time - modifier.start_time) * 1000
                 if elapsed >= modifier.duration:
                     expired.append(source)
                     
@@ -4,6 +4,7 @@ setup(
     name="combat",
     version="0.1.0",
     packages=find_packages(),
+    python_requires=">=3.10",
     install_requires=[
         "pytest>=7.4.3",
         "pytest-cov>=4.1.0",
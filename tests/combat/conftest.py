@@ -12,7 +12,9 @@ from datetime import datetime
 from combat.lib.action_system import (
     ActionStateType,
     ActionVisibility,
+    ActionSystem,
 )
+from combat.combatant import TestCombatant as LegacyCombatant
 
 @dataclass
 class PerformanceStats:
@@ -145,6 +147,11 @@ class CombatantState:
     position_y: float
     stats: Dict[str, Any] = field(default_factory=dict)
 
+@pytest.fixture(scope="session")
+def action_system():
+    """Provide an action system shared by tests that only read its tables."""
+    return ActionSystem()
+
 @pytest.fixture
 def performance_stats():
     """Provide performance tracking."""
@@ -190,6 +197,32 @@ def create_test_combatant_state(
         stats=stats
     )
 
+def create_legacy_combatant() -> LegacyCombatant:
+    """Create a legacy combatant with standard attributes."""
+    return LegacyCombatant(
+        combatant_id=1,
+        name="Test Fighter",
+        health=100,
+        stamina=100,
+        attack_power=20,
+        accuracy=100,
+        blocking_power=30,
+        evading_ability=0,
+        mobility=50,
+        range_a=0,
+        range_b=50,
+        stamina_recovery=10,
+        position="left",
+        facing="right",
+        perception=0,
+        stealth=0
+    )
+
+@pytest.fixture(scope="session")
+def legacy_combatant_template():
+    """Provide a legacy combatant built once; tests should use copies."""
+    return create_legacy_combatant()
+
 @pytest.fixture
 def test_sequence():
     """Provide a test combat sequence."""
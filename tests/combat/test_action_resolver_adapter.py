@@ -5,29 +5,51 @@ These tests verify that the adapter correctly implements the IActionResolver int
 and maintains the expected action resolution behavior.
 """
 
+import copy
+from dataclasses import replace
 import pytest
 from combat.adapters import ActionResolverAdapter, CombatantAdapter
 from combat.interfaces import Action, ActionResult
 from combat.lib.actions_library import ACTIONS
-from tests.combat.test_combatant_adapter import create_test_combatant
+
+# Shared prototype; tests fill in source/target ids via dataclasses.replace
+_RELEASE_ATTACK = Action(
+    action_type="release_attack",
+    stamina_cost=0,
+    time_cost=100,
+    speed_requirement=1.0,
+    description="Release attack",
+    properties={}
+)
+
+def _make_action(action_type, source_id):
+    """Build a library action issued by ``source_id`` with no target."""
+    return Action(
+        action_type=action_type,
+        stamina_cost=ACTIONS[action_type]["stamina_cost"],
+        time_cost=100,
+        speed_requirement=1.0,
+        description=action_type.replace("_", " ").capitalize(),
+        properties={"source_id": source_id}
+    )
 
 class TestActionResolverAdapter:
     """Test suite for ActionResolverAdapter class."""
 
     @pytest.fixture
     def resolver(self):
-        """Create a fresh resolver instance for each test."""
-        return ActionResolverAdapter()
+        """Create a fresh, deterministically seeded resolver for each test."""
+        return ActionResolverAdapter(seed=0)
 
     @pytest.fixture
-    def attacker(self):
+    def attacker(self, legacy_combatant_template):
         """Create an attacking combatant."""
-        return CombatantAdapter(create_test_combatant())
+        return CombatantAdapter(copy.copy(legacy_combatant_template))
 
     @pytest.fixture
-    def defender(self):
+    def defender(self, legacy_combatant_template):
         """Create a defending combatant."""
-        combatant = create_test_combatant()
+        combatant = copy.copy(legacy_combatant_template)
         combatant.position = "right"
         combatant.facing = "left"
         return CombatantAdapter(combatant)
@@ -77,17 +99,10 @@ class TestActionResolverAdapter:
 
     def test_resolve_attack_hit(self, resolver, attacker, defender):
         """Test resolving a successful attack."""
-        action = Action(
-            action_type="release_attack",
-            stamina_cost=0,
-            time_cost=100,
-            speed_requirement=1.0,
-            description="Release attack",
-            properties={
-                "source_id": attacker.get_state().entity_id,
-                "target_id": defender.get_state().entity_id
-            }
-        )
+        action = replace(_RELEASE_ATTACK, properties={
+            "source_id": attacker.get_state().entity_id,
+            "target_id": defender.get_state().entity_id
+        })
         
         result = resolver.resolve(action, attacker, defender)
         
@@ -105,17 +120,10 @@ class TestActionResolverAdapter:
             "status": "pending"
         }
         
-        action = Action(
-            action_type="release_attack",
-            stamina_cost=0,
-            time_cost=100,
-            speed_requirement=1.0,
-            description="Release attack",
-            properties={
-                "source_id": attacker.get_state().entity_id,
-                "target_id": defender.get_state().entity_id
-            }
-        )
+        action = replace(_RELEASE_ATTACK, properties={
+            "source_id": attacker.get_state().entity_id,
+            "target_id": defender.get_state().entity_id
+        })
         
         result = resolver.resolve(action, attacker, defender)
         
@@ -135,17 +143,10 @@ class TestActionResolverAdapter:
             "status": "pending"
         }
         
-        action = Action(
-            action_type="release_attack",
-            stamina_cost=0,
-            time_cost=100,
-            speed_requirement=1.0,
-            description="Release attack",
-            properties={
-                "source_id": attacker.get_state().entity_id,
-                "target_id": defender.get_state().entity_id
-            }
-        )
+        action = replace(_RELEASE_ATTACK, properties={
+            "source_id": attacker.get_state().entity_id,
+            "target_id": defender.get_state().entity_id
+        })
         
         result = resolver.resolve(action, attacker, defender)
         
@@ -153,103 +154,37 @@ class TestActionResolverAdapter:
         assert result.outcome == "evaded"
         assert result.damage == 0
 
-    def test_resolve_movement(self, resolver, attacker):
-        """Test resolving movement actions."""
-        # Test move forward
-        forward_action = Action(
-            action_type="move_forward",
-            stamina_cost=ACTIONS["move_forward"]["stamina_cost"],
-            time_cost=100,
-            speed_requirement=1.0,
-            description="Move forward",
-            properties={
-                "source_id": attacker.get_state().entity_id
-            }
-        )
-        
-        result = resolver.resolve(forward_action, attacker, None)
-        
-        assert result.success is True
-        assert result.outcome == "move_forward"
-        assert "distance" in result.state_changes
-        assert result.state_changes["distance"] < 0  # Moving forward reduces distance
-
-        # Test move backward
-        backward_action = Action(
-            action_type="move_backward",
-            stamina_cost=ACTIONS["move_backward"]["stamina_cost"],
-            time_cost=100,
-            speed_requirement=1.0,
-            description="Move backward",
-            properties={
-                "source_id": attacker.get_state().entity_id
-            }
-        )
-        
-        result = resolver.resolve(backward_action, attacker, None)
-        
-        assert result.success is True
-        assert result.outcome == "move_backward"
-        assert "distance" in result.state_changes
-        assert result.state_changes["distance"] > 0  # Moving backward increases distance
-
-    def test_resolve_neutral_actions(self, resolver, attacker):
-        """Test resolving neutral actions."""
-        # Test recover action
-        recover_action = Action(
-            action_type="recover",
-            stamina_cost=ACTIONS["recover"]["stamina_cost"],
-            time_cost=100,
-            speed_requirement=1.0,
-            description="Recover stamina",
-            properties={
-                "source_id": attacker.get_state().entity_id
-            }
-        )
-        
-        result = resolver.resolve(recover_action, attacker, None)
-        
-        assert result.success is True
-        assert result.outcome == "recover"
-        assert "actor_stamina" in result.state_changes
-        assert result.state_changes["actor_stamina"] > 0  # Recovery adds stamina
-
-    def test_resolve_block(self, resolver, attacker):
-        """Test resolving block actions."""
-        block_action = Action(
-            action_type="blocking",
-            stamina_cost=ACTIONS["blocking"]["stamina_cost"],
-            time_cost=100,
-            speed_requirement=1.0,
-            description="Block attacks",
-            properties={
-                "source_id": attacker.get_state().entity_id
-            }
-        )
-        
-        result = resolver.resolve(block_action, attacker, None)
-        
-        assert result.success is True
-        assert result.outcome == "blocking"
-        assert "actor_stamina" in result.state_changes
-        assert result.state_changes["actor_stamina"] < 0  # Blocking costs stamina
-
-    def test_resolve_evade(self, resolver, attacker):
-        """Test resolving evade actions."""
-        evade_action = Action(
-            action_type="evading",
-            stamina_cost=ACTIONS["evading"]["stamina_cost"],
-            time_cost=100,
-            speed_requirement=1.0,
-            description="Evade attacks",
-            properties={
-                "source_id": attacker.get_state().entity_id
-            }
-        )
-        
-        result = resolver.resolve(evade_action, attacker, None)
-        
+    @pytest.mark.parametrize("action_type, state_key, sign", [
+        ("recover", "actor_stamina", 1),         # Recovery adds stamina
+        ("blocking", "actor_stamina", -1),       # Blocking costs stamina
+        ("evading", "actor_stamina", -1),        # Evading costs stamina
+        ("move_forward", "distance", -1),        # Moving forward reduces distance
+        ("move_backward", "distance", 1),        # Moving backward increases distance
+    ])
+    def test_resolve_self_action(self, resolver, attacker, action_type, state_key, sign):
+        """Test resolving actions that only affect the acting combatant."""
+        action = _make_action(action_type, attacker.get_state().entity_id)
+
+        result = resolver.resolve(action, attacker, None)
+
         assert result.success is True
-        assert result.outcome == "evading"
-        assert "actor_stamina" in result.state_changes
-        assert result.state_changes["actor_stamina"] < 0  # Evading costs stamina
+        assert result.outcome == action_type
+        assert state_key in result.state_changes
+        assert result.state_changes[state_key] * sign > 0
+
+    @pytest.mark.parametrize("low, high, draws", [
+        (0, 0, 10),                       # Single value
+        (40, 50, 2000),                   # Multiply-shift branch
+        (0, 1 << 16, 1_000_000),          # Smallest randrange branch span
+    ])
+    def test_roll_damage_bounds(self, resolver, low, high, draws):
+        """Test that rolled damage covers exactly [low, high]."""
+        rolls = [resolver.roll_damage(low, high) for _ in range(draws)]
+        
+        assert min(rolls) == low
+        assert max(rolls) == high
+
+    def test_roll_damage_empty_range(self, resolver):
+        """Test that an empty damage range raises like randint did."""
+        with pytest.raises(ValueError):
+            resolver.roll_damage(10, 5)
@@ -5,73 +5,36 @@ These tests verify the functionality of action states,
 visibility mechanics, and commitment levels.
 """
 
+import operator
 import pytest
-from datetime import datetime
 from combat.lib.action_system import (
     ActionStateType,
     ActionVisibility,
     ActionCommitment,
     ActionPhase,
-    ActionSystem,
     ActionState
 )
 from tests.combat.conftest import PerformanceStats
 
+# (from_state, to_state, valid)
+TRANSITIONS = [
+    (ActionStateType.FEINT, ActionStateType.COMMIT, True),
+    (ActionStateType.FEINT, ActionStateType.RELEASE, True),
+    (ActionStateType.COMMIT, ActionStateType.RELEASE, True),
+    (ActionStateType.RELEASE, ActionStateType.RECOVERY, True),
+    (ActionStateType.RECOVERY, ActionStateType.FEINT, False),   # Can't transition from recovery
+    (ActionStateType.FEINT, ActionStateType.RECOVERY, False),   # Can't skip states
+    (ActionStateType.COMMIT, ActionStateType.FEINT, False),     # Can't go backwards
+    (ActionStateType.RELEASE, ActionStateType.COMMIT, False),
+]
+
 class TestActionStateTransitions:
     """Test suite for action state transitions."""
 
-    @pytest.fixture
-    def action_system(self):
-        """Create a fresh action system."""
-        return ActionSystem()
-
-    def test_state_transitions(self, action_system):
-        """Test valid state transitions."""
-        # Start with feint
-        assert action_system.validate_transition(
-            ActionStateType.FEINT,
-            ActionStateType.COMMIT
-        )
-        assert action_system.validate_transition(
-            ActionStateType.FEINT,
-            ActionStateType.RELEASE
-        )
-        
-        # Commit to release
-        assert action_system.validate_transition(
-            ActionStateType.COMMIT,
-            ActionStateType.RELEASE
-        )
-        
-        # Release to recovery
-        assert action_system.validate_transition(
-            ActionStateType.RELEASE,
-            ActionStateType.RECOVERY
-        )
-        
-        # Can't transition from recovery
-        assert not action_system.validate_transition(
-            ActionStateType.RECOVERY,
-            ActionStateType.FEINT
-        )
-
-    def test_invalid_transitions(self, action_system):
-        """Test invalid state transitions."""
-        # Can't skip states
-        assert not action_system.validate_transition(
-            ActionStateType.FEINT,
-            ActionStateType.RECOVERY
-        )
-        
-        # Can't go backwards
-        assert not action_system.validate_transition(
-            ActionStateType.COMMIT,
-            ActionStateType.FEINT
-        )
-        assert not action_system.validate_transition(
-            ActionStateType.RELEASE,
-            ActionStateType.COMMIT
-        )
+    @pytest.mark.parametrize("src, dst, expected", TRANSITIONS)
+    def test_transition(self, action_system, src, dst, expected):
+        """Test each entry of the state transition matrix."""
+        assert action_system.validate_transition(src, dst) == expected
         
     def test_state_properties(self, action_system):
         """Test action state properties."""
@@ -91,11 +54,6 @@ class TestActionStateTransitions:
 class TestActionVisibility:
     """Test suite for action visibility mechanics."""
 
-    @pytest.fixture
-    def action_system(self):
-        """Create a fresh action system."""
-        return ActionSystem()
-
     def test_visibility_modifiers(self, action_system):
         """Test visibility modifier calculations."""
         # Base visibility
@@ -147,37 +105,23 @@ class TestActionVisibility:
             perception=1.0
         )
 
-    def test_edge_cases(self, action_system):
+    @pytest.mark.parametrize("stealth, movement, compare, bound", [
+        (0.0, 0.0, operator.eq, 1.0),     # Zero stats: fully visible
+        (100.0, 0.0, operator.lt, 0.1),   # Very high stats: nearly invisible
+        (100.0, 2.0, operator.gt, 0.5),   # Movement cancels stealth
+    ])
+    def test_edge_cases(self, action_system, stealth, movement, compare, bound):
         """Test visibility edge cases."""
-        # Zero stats
-        assert action_system.calculate_visibility(
+        visibility = action_system.calculate_visibility(
             ActionVisibility.HIDDEN,
-            stealth=0.0,
-            movement=0.0
-        ) == 1.0  # Should be fully visible
-        
-        # Very high stats
-        assert action_system.calculate_visibility(
-            ActionVisibility.HIDDEN,
-            stealth=100.0,
-            movement=0.0
-        ) < 0.1  # Should be nearly invisible
-        
-        # Movement cancels stealth
-        assert action_system.calculate_visibility(
-            ActionVisibility.HIDDEN,
-            stealth=100.0,
-            movement=2.0
-        ) > 0.5  # Should be more visible
+            stealth=stealth,
+            movement=movement
+        )
+        assert compare(visibility, bound)
 
 class TestActionCommitment:
     """Test suite for action commitment mechanics."""
 
-    @pytest.fixture
-    def action_system(self):
-        """Create a fresh action system."""
-        return ActionSystem()
-
     def test_commitment_costs(self, action_system):
         """Test commitment level costs."""
         base_cost = 10.0
@@ -217,26 +161,17 @@ class TestActionCommitment:
         with pytest.raises(ValueError):
             action_system.get_cancel_cost(ActionCommitment.FULL)
 
-    def test_edge_cases(self, action_system):
-        """Test commitment edge cases."""
-        # Zero base cost
-        assert action_system.calculate_cost(0.0, ActionCommitment.FULL) == 0.0
-        
-        # Very high base cost
-        high_cost = 1000.0
+    @pytest.mark.parametrize("base_cost", [0.0, 1000.0])
+    def test_edge_cases(self, action_system, base_cost):
+        """Test commitment edge cases (zero and very high base cost)."""
         assert action_system.calculate_cost(
-            high_cost,
+            base_cost,
             ActionCommitment.FULL
-        ) == high_cost * action_system.FULL_COMMIT_COST
+        ) == base_cost * action_system.FULL_COMMIT_COST
 
 class TestActionPhases:
     """Test suite for action phase mechanics."""
 
-    @pytest.fixture
-    def action_system(self):
-        """Create a fresh action system."""
-        return ActionSystem()
-
     def test_phase_timing(self, action_system):
         """Test phase timing calculations."""
         base_duration = 1.0
@@ -280,21 +215,19 @@ class TestActionPhases:
             commitment=ActionCommitment.FULL
         )
 
-    def test_edge_cases(self, action_system):
+    @pytest.mark.parametrize("phase, duration, compare, bound", [
+        (ActionPhase.STARTUP, 0.0, operator.eq, 0.0),    # Zero duration
+        (ActionPhase.ACTIVE, 0.001, operator.gt, 0.0),   # Very short duration
+    ])
+    def test_edge_cases(self, action_system, phase, duration, compare, bound):
         """Test phase timing edge cases."""
-        # Zero duration
-        assert action_system.calculate_phase_duration(
-            ActionPhase.STARTUP,
-            0.0
-        ) == 0.0
-        
-        # Very short duration
-        assert action_system.calculate_phase_duration(
-            ActionPhase.ACTIVE,
-            0.001
-        ) > 0.0
-        
-        # Very long duration
+        assert compare(
+            action_system.calculate_phase_duration(phase, duration),
+            bound
+        )
+
+    def test_long_recovery_duration(self, action_system):
+        """Test that recovery scales with very long durations."""
         long_duration = 1000.0
         assert action_system.calculate_phase_duration(
             ActionPhase.RECOVERY,
@@ -304,11 +237,6 @@ class TestActionPhases:
 class TestIntegration:
     """Integration tests for action system."""
 
-    @pytest.fixture
-    def action_system(self):
-        """Create a fresh action system."""
-        return ActionSystem()
-
     def test_complete_action_flow(self, action_system):
         """Test complete action execution flow."""
         # Initial state
@@ -336,29 +264,24 @@ class TestIntegration:
         assert state.phase == ActionPhase.COMPLETE
         assert state.state == ActionStateType.RECOVERY
 
-    def test_performance(self, action_system, performance_stats):
-        """Test action system performance."""
-        # Measure state update performance
-        start_time = datetime.now()
+    def test_update_performance(self, action_system, benchmark):
+        """Benchmark action state updates."""
         state = action_system.start_action("test", ActionVisibility.TELEGRAPHED)
-        for _ in range(1000):
-            state = action_system.update_action(state, 0.016)  # 60 FPS
-        update_time = (datetime.now() - start_time).total_seconds()
-        performance_stats.record_operation("action_update", update_time)
-        
-        # Measure validation performance
-        start_time = datetime.now()
-        for _ in range(1000):
-            action_system.validate_transition(
-                ActionStateType.FEINT,
-                ActionStateType.COMMIT
-            )
-        validation_time = (datetime.now() - start_time).total_seconds()
-        performance_stats.record_operation("state_validation", validation_time)
-        
-        # Verify performance
-        assert update_time < 0.1  # Should handle 1000 updates quickly
-        assert validation_time < 0.1  # Should validate quickly
+        benchmark.pedantic(
+            action_system.update_action,
+            args=(state, 0.016),  # 60 FPS
+            iterations=1000,
+            rounds=5
+        )
+
+    def test_validation_performance(self, action_system, benchmark):
+        """Benchmark state transition validation."""
+        benchmark.pedantic(
+            action_system.validate_transition,
+            args=(ActionStateType.FEINT, ActionStateType.COMMIT),
+            iterations=1000,
+            rounds=5
+        )
 
     def test_edge_cases(self, action_system):
         """Test integration edge cases."""
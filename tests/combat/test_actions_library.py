@@ -6,6 +6,7 @@ interactions with the core systems.
 """
 
 import pytest
+from dataclasses import replace
 from combat.lib.actions_library import (
     ACTIONS,
     create_action,
@@ -20,6 +21,21 @@ from combat.lib.action_system import (
 )
 from tests.combat.conftest import create_test_combatant_state
 
+# Action chains shared by the chain validation tests
+_CHAIN_VALID = (
+    create_action("move_forward", "fighter_1"),
+    create_action("quick_attack", "fighter_1", "fighter_2"),
+    create_action("move_backward", "fighter_1")
+)
+_CHAIN_BACK_FORWARD = (
+    create_action("move_backward", "fighter_1"),
+    create_action("move_forward", "fighter_1")
+)
+_CHAIN_DOUBLE_ATTACK = (
+    create_action("quick_attack", "fighter_1", "fighter_2"),
+    create_action("quick_attack", "fighter_1", "fighter_2")
+)
+
 class TestActionDefinitions:
     """Test suite for action definitions."""
 
@@ -103,31 +119,23 @@ class TestActionChains:
 
     def test_valid_chain(self):
         """Test valid action chain."""
-        chain = [
-            create_action("move_forward", "fighter_1"),
-            create_action("quick_attack", "fighter_1", "fighter_2"),
-            create_action("move_backward", "fighter_1")
-        ]
-        
-        assert validate_action_chain(chain)
+        assert validate_action_chain(_CHAIN_VALID)
 
     def test_invalid_chain(self):
         """Test invalid action chain."""
         # Can't move backward then forward immediately
-        chain = [
-            create_action("move_backward", "fighter_1"),
-            create_action("move_forward", "fighter_1")
-        ]
-        
-        assert not validate_action_chain(chain)
+        assert not validate_action_chain(_CHAIN_BACK_FORWARD)
         
         # Can't attack twice in a row without recovery
-        chain = [
-            create_action("quick_attack", "fighter_1", "fighter_2"),
-            create_action("quick_attack", "fighter_1", "fighter_2")
-        ]
+        assert not validate_action_chain(_CHAIN_DOUBLE_ATTACK)
+
+    def test_unknown_type_chain(self):
+        """Test that chains containing an unknown action type are invalid."""
+        unknown = replace(_CHAIN_VALID[0], action_type="unknown_action")
         
-        assert not validate_action_chain(chain)
+        assert not validate_action_chain([unknown, unknown])
+        assert not validate_action_chain([unknown, _CHAIN_VALID[1]])
+        assert not validate_action_chain([_CHAIN_VALID[0], unknown])
 
     def test_commitment_chain(self):
         """Test chains with commitments."""
@@ -169,11 +177,12 @@ class TestActionAvailability:
         )
         
         actions = get_available_actions(state)
+        types = {a.type for a in actions}
         
         # Should have basic actions
-        assert any(a.type == "quick_attack" for a in actions)
-        assert any(a.type == "block" for a in actions)
-        assert any(a.type == "move_forward" for a in actions)
+        assert "quick_attack" in types
+        assert "block" in types
+        assert "move_forward" in types
 
     def test_stamina_restrictions(self):
         """Test stamina-based restrictions."""
@@ -184,13 +193,12 @@ class TestActionAvailability:
         )
         
         actions = get_available_actions(low_stamina)
+        types = {a.type for a in actions}
+        committed = {(a.type, a.commitment) for a in actions}
         
         # Should not have high-cost actions
-        assert not any(a.type == "heavy_attack" for a in actions)
-        assert not any(
-            a.type == "quick_attack" and a.commitment == ActionCommitment.FULL
-            for a in actions
-        )
+        assert "heavy_attack" not in types
+        assert ("quick_attack", ActionCommitment.FULL) not in committed
 
     def test_speed_restrictions(self):
         """Test speed-based restrictions."""
@@ -201,10 +209,11 @@ class TestActionAvailability:
         )
         
         actions = get_available_actions(low_speed)
+        types = {a.type for a in actions}
         
         # Should not have quick actions
-        assert not any(a.type == "quick_attack" for a in actions)
-        assert not any(a.type == "parry" for a in actions)
+        assert "quick_attack" not in types
+        assert "parry" not in types
 
 class TestIntegration:
     """Integration tests for actions library."""
@@ -246,41 +255,29 @@ class TestIntegration:
         assert validate_action_chain(sequence)
         
         # Each action should be available when it's used
+        available_keys = {
+            fighter.entity_id: {
+                (a.type, a.commitment) for a in get_available_actions(fighter)
+            }
+            for fighter in (fighter_1, fighter_2)
+        }
         for action in sequence:
-            if action.source_id == "fighter_1":
-                state = fighter_1
-            else:
-                state = fighter_2
-                
-            available = get_available_actions(state)
-            assert any(
-                a.type == action.type and
-                a.commitment == action.commitment
-                for a in available
-            )
+            assert (action.type, action.commitment) in available_keys[action.source_id]
 
-    def test_performance(self, performance_stats):
-        """Test actions library performance."""
-        # Measure action creation performance
-        start_time = datetime.now()
-        for _ in range(1000):
-            create_action("quick_attack", "fighter_1", "fighter_2")
-        creation_time = (datetime.now() - start_time).total_seconds()
-        performance_stats.record_operation("action_creation", creation_time)
-        
-        # Measure chain validation performance
-        chain = [
-            create_action("move_forward", "fighter_1"),
-            create_action("quick_attack", "fighter_1", "fighter_2"),
-            create_action("move_backward", "fighter_1")
-        ]
-        
-        start_time = datetime.now()
-        for _ in range(1000):
-            validate_action_chain(chain)
-        validation_time = (datetime.now() - start_time).total_seconds()
-        performance_stats.record_operation("chain_validation", validation_time)
-        
-        # Verify performance
-        assert creation_time < 0.1  # Should create actions quickly
-        assert validation_time < 0.1  # Should validate chains quickly
+    def test_creation_performance(self, benchmark):
+        """Benchmark action creation."""
+        benchmark.pedantic(
+            create_action,
+            args=("quick_attack", "fighter_1", "fighter_2"),
+            iterations=1000,
+            rounds=5
+        )
+
+    def test_chain_validation_performance(self, benchmark):
+        """Benchmark action chain validation."""
+        benchmark.pedantic(
+            validate_action_chain,
+            args=(_CHAIN_VALID,),
+            iterations=1000,
+            rounds=5
+        )
@@ -202,25 +202,27 @@ class TestAdapterIntegration:
         
         # Measure state updates
         start_time = datetime.now()
-        for i in range(1000):
-            state = create_test_combatant_state(
+        combat_system._state_manager.update_state_batch(
+            create_test_combatant_state(
                 combatant.id,
                 stamina=100.0 - i * 0.1,
                 speed=1.0
             )
-            combat_system._state_manager.update_state(state)
+            for i in range(1000)
+        )
         state_time = (datetime.now() - start_time).total_seconds()
         performance_stats.record_operation("state_updates", state_time)
         
         # Measure event dispatch
         start_time = datetime.now()
+        timestamp = datetime.now()
         for i in range(1000):
             event = EnhancedEvent(
                 event_id=f"test_{i}",
                 event_type="test",
                 category=EventCategory.COMBAT,
                 importance=EventImportance.MINOR,
-                timestamp=datetime.now(),
+                timestamp=timestamp,
                 source_id=combatant.id,
                 target_id=None,
                 data={"index": i}
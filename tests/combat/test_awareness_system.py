@@ -103,7 +103,8 @@ class TestAwarenessState:
         assert basic_state.confidence == 0.6
         assert basic_state.last_clear_position == (10.0, 10.0)
         assert basic_state.last_update_time == 100.0
-        assert isinstance(basic_state.modifiers, dict)
+        assert basic_state.modifiers == ()
+        assert basic_state.modifier(PerceptionModifier.ANGLE) == 0.0
 
 class TestAwarenessSystem:
     """Test suite for the awareness system."""
@@ -135,8 +136,8 @@ class TestAwarenessSystem:
     def test_combatant_registration(self, system):
         """Test combatant registration."""
         system.register_combatant("observer1")
-        assert "observer1" in system._awareness_states
-        assert isinstance(system._awareness_states["observer1"], dict)
+        assert system._targets_by_observer["observer1"] == set()
+        assert system.get_awareness("observer1", "target1") is None
 
     def test_awareness_update(self, system, observer_stats, target_stats):
         """Test awareness state updates."""
@@ -154,6 +155,39 @@ class TestAwarenessSystem:
         assert state.zone in AwarenessZone
         assert 0.0 <= state.confidence <= 1.0
         assert state.last_update_time == 100.0
+        assert state.modifier(PerceptionModifier.MOVEMENT) == 0.5
+        assert state.modifier(PerceptionModifier.STEALTH) == 3.0
+
+    def test_modifier_slots(self, observer_stats, target_stats):
+        """Test that each modifier is stored under its PerceptionModifier."""
+        conditions = EnvironmentConditions(
+            lighting_level=0.25,
+            cover_density=0.5,
+            distraction_level=0.75
+        )
+        system = AwarenessSystem(conditions)
+        state = system.update_awareness(
+            observer_id="observer1",
+            target_id="target1",
+            observer_stats=observer_stats,
+            target_stats=target_stats,
+            distance=10.0,
+            angle=90.0,
+            current_time=100.0
+        )
+        
+        expected = {
+            PerceptionModifier.DISTANCE: 10.0 / conditions.visibility_range,
+            PerceptionModifier.ANGLE: 0.5,
+            PerceptionModifier.LIGHTING: 0.25,
+            PerceptionModifier.COVER: 0.5,
+            PerceptionModifier.MOVEMENT: 0.5,
+            PerceptionModifier.STEALTH: 3.0,
+            PerceptionModifier.DISTRACTION: 0.75
+        }
+        assert len(state.modifiers) == len(PerceptionModifier)
+        for kind in PerceptionModifier:
+            assert state.modifier(kind) == pytest.approx(expected[kind])
 
     def test_awareness_zones(self, system, observer_stats, target_stats):
         """Test zone transitions based on confidence."""
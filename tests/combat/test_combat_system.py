@@ -1,81 +1,74 @@
 # test_combat.py
+import copy
 import pytest
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from combat.combat_system import CombatSystem
 from combat.combatant import TestCombatant
 from combat.lib.actions_library import ACTIONS
 
+# Combatants are built once; fixtures hand out shallow copies
+_ATTACKER = TestCombatant(
+    combatant_id=1,
+    name="Attacker",
+    health=100,
+    stamina=100,
+    attack_power=20,
+    accuracy=100,
+    blocking_power=0,
+    evading_ability=0,
+    mobility=50,
+    range_a=0,
+    range_b=50,
+    stamina_recovery=10,
+    position="left",
+    facing="right",
+    perception=0,
+    stealth=0
+)
+
+_DEFENDER = TestCombatant(
+    combatant_id=2,
+    name="Defender",
+    health=100,
+    stamina=100,
+    attack_power=0,
+    accuracy=0,
+    blocking_power=30,
+    evading_ability=0,
+    mobility=50,
+    range_a=0,
+    range_b=50,
+    stamina_recovery=10,
+    position="right",
+    facing="left",
+    perception=0,
+    stealth=0
+)
+
 @pytest.fixture
 def attacker():
-    return TestCombatant(
-        combatant_id=1,
-        name="Attacker",
-        health=100,
-        stamina=100,
-        attack_power=20,
-        accuracy=100,
-        blocking_power=0,
-        evading_ability=0,
-        mobility=50,
-        range_a=0,
-        range_b=50,
-        stamina_recovery=10,
-        position="left",
-        facing="right",
-        perception=0,
-        stealth=0
-    )
+    return copy.copy(_ATTACKER)
 
 @pytest.fixture
 def defender():
-    return TestCombatant(
-        combatant_id=2,
-        name="Defender",
-        health=100,
-        stamina=100,
-        attack_power=0,
-        accuracy=0,
-        blocking_power=30,
-        evading_ability=0,
-        mobility=50,
-        range_a=0,
-        range_b=50,
-        stamina_recovery=10,
-        position="right",
-        facing="left",
-        perception=0,
-        stealth=0
-    )
-
-def test_determine_next_event_priority(attacker, defender):
-    battle = init_battle(attacker, defender, duration=1000, distance=0, max_distance=100)
-    
-    # Force multiple actions with different priorities
-    attacker.force_action("try_attack", 0, battle.event_counter, battle.distance)  # Higher priority
-    defender.force_action("move_backward", 0, battle.event_counter, battle.distance)  # Lower priority
-    
-    # Determine next event
-    battle.determine_next_event()
-    
-    # Check if higher priority action was chosen
-    assert battle.next_event["type"] == "try_attack", "Higher priority action should be chosen"
-    assert battle.next_event["combatant"] == attacker, "Attacker's action should be chosen"
+    return copy.copy(_DEFENDER)
 
-def test_determine_next_event_timing(attacker, defender):
+@pytest.mark.parametrize("attack_time,move_time,expected_type,expected_side", [
+    (0, 0, "try_attack", "attacker"),      # Same time: higher priority wins
+    (100, 0, "move_backward", "defender"), # Earlier action wins
+])
+def test_determine_next_event(attacker, defender, attack_time, move_time, expected_type, expected_side):
     battle = init_battle(attacker, defender, duration=1000, distance=0, max_distance=100)
     
-    # Force actions with different timings
-    attacker.force_action("try_attack", 100, battle.event_counter, battle.distance)  # Later time
-    defender.force_action("move_backward", 0, battle.event_counter, battle.distance)  # Earlier time
+    # Force actions with different priorities and timings
+    attacker.force_action("try_attack", attack_time, battle.event_counter, battle.distance)
+    defender.force_action("move_backward", move_time, battle.event_counter, battle.distance)
     
     # Determine next event
     battle.determine_next_event()
     
-    # Check if earlier action was chosen
-    assert battle.next_event["type"] == "move_backward", "Earlier action should be chosen"
-    assert battle.next_event["combatant"] == defender, "Defender's action should be chosen"
+    expected_combatant = attacker if expected_side == "attacker" else defender
+    assert battle.next_event["type"] == expected_type
+    assert battle.next_event["combatant"] == expected_combatant
 
 def test_process_event(attacker, defender):
     battle = init_battle(attacker, defender, duration=1000, distance=0, max_distance=100)
@@ -194,9 +187,9 @@ def test_simultaneous_actions(attacker, defender):
 
 # Helpers    
 def init_battle(attacker, defender, duration, distance, max_distance):
-    battle = CombatSystem(duration=duration, distance=distance, max_distance=max_distance)
-    battle.add_combatant(attacker)
-    battle.add_combatant(defender)
+    battle = CombatSystem.from_combatants(
+        [attacker, defender], duration=duration, distance=distance, max_distance=max_distance
+    )
     battle.get_opponent_data(attacker, defender)
     battle.get_opponent_data(defender, attacker)
     return battle
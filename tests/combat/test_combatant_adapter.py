@@ -5,41 +5,20 @@ These tests verify that the adapter correctly implements the ICombatant interfac
 and maintains compatibility with the existing combat system.
 """
 
+import copy
 import pytest
 from combat.adapters import CombatantAdapter
-from combat.combatant import TestCombatant
 from combat.interfaces import Action, CombatantState
 from combat.lib.actions_library import ACTIONS
-
-def create_test_combatant():
-    """Create a test combatant with standard attributes."""
-    return TestCombatant(
-        combatant_id=1,
-        name="Test Fighter",
-        health=100,
-        stamina=100,
-        attack_power=20,
-        accuracy=100,
-        blocking_power=30,
-        evading_ability=0,
-        mobility=50,
-        range_a=0,
-        range_b=50,
-        stamina_recovery=10,
-        position="left",
-        facing="right",
-        perception=0,
-        stealth=0
-    )
+from tests.combat.conftest import create_legacy_combatant
 
 class TestCombatantAdapter:
     """Test suite for CombatantAdapter class."""
 
     @pytest.fixture
-    def adapter(self):
+    def adapter(self, legacy_combatant_template):
         """Create a fresh adapter instance for each test."""
-        combatant = create_test_combatant()
-        return CombatantAdapter(combatant)
+        return CombatantAdapter(copy.copy(legacy_combatant_template))
 
     def test_get_state(self, adapter):
         """Test that get_state returns correct CombatantState."""
@@ -99,7 +78,7 @@ class TestCombatantAdapter:
 
     def test_is_facing_opponent(self, adapter):
         """Test opponent facing check."""
-        opponent = create_test_combatant()
+        opponent = create_legacy_combatant()
         opponent.position = "right"  # Adapter's facing is "right"
         
         assert adapter.is_facing_opponent(CombatantAdapter(opponent)) is True
@@ -148,7 +127,7 @@ class TestCombatantAdapter:
 
     def test_adapter_with_opponent_interaction(self, adapter):
         """Test adapter interaction with another adapter instance."""
-        opponent = CombatantAdapter(create_test_combatant())
+        opponent = CombatantAdapter(create_legacy_combatant())
         opponent.adaptee.position = "right"
         opponent.adaptee.facing = "left"
         
@@ -177,7 +177,6 @@ class TestCombatFlow:
         
         # Should progress through states
         action_state = combat_system._action_system.get_action_state(action.action_id)
-        print(f"DEBUG: This action: {action.action_id} has state: {action.state}")
         assert action_state.state == ActionStateType.RELEASE
         
         # Complete action
@@ -11,8 +11,12 @@ from queue import Queue
 import time
 from combat.adapters import EventDispatcherAdapter
 from combat.interfaces import CombatEvent
+from combat.lib.event_system import EnhancedEvent, EventCategory, EventImportance
 from datetime import datetime
 
+# Fixed event time, so tests do not read the clock per event
+FIXED_TS = datetime(2024, 1, 1)
+
 class TestEventDispatcherAdapter:
     """Test suite for EventDispatcherAdapter class."""
 
@@ -27,7 +31,7 @@ class TestEventDispatcherAdapter:
         return CombatEvent(
             event_id="test_1",
             event_type="test_event",
-            timestamp=datetime.now(),
+            timestamp=FIXED_TS,
             source_id="source_1",
             target_id="target_1",
             data={"test": "data"}
@@ -141,7 +145,7 @@ class TestEventDispatcherAdapter:
         event1 = CombatEvent(
             event_id="test_1",
             event_type="event1",
-            timestamp=datetime.now(),
+            timestamp=FIXED_TS,
             source_id="source_1",
             target_id="target_1",
             data={}
@@ -150,7 +154,7 @@ class TestEventDispatcherAdapter:
         event2 = CombatEvent(
             event_id="test_2",
             event_type="event2",
-            timestamp=datetime.now(),
+            timestamp=FIXED_TS,
             source_id="source_1",
             target_id="target_1",
             data={}
@@ -173,6 +177,25 @@ class TestEventDispatcherAdapter:
         assert dispatcher.has_subscribers("event1") is False
         assert dispatcher.has_subscribers("event2") is False
 
+    def test_category_subscriber_receives_lib_event(self, dispatcher):
+        """Test that lib event categories reach matching category subscribers."""
+        received = []
+        dispatcher.subscribe("movement", received.append)
+        
+        for category in EventCategory:
+            dispatcher.dispatch(EnhancedEvent(
+                event_id=f"{category.name}_1",
+                event_type="lib_event",
+                category=category,
+                importance=EventImportance.MAJOR,
+                timestamp=FIXED_TS,
+                source_id="source_1",
+                target_id=None,
+                data={}
+            ))
+        
+        assert [event.category for event in received] == [EventCategory.MOVEMENT]
+
     def test_dispatch_batch(self, dispatcher):
         """Test batch event dispatching."""
         received_events = []
@@ -186,7 +209,7 @@ class TestEventDispatcherAdapter:
             CombatEvent(
                 event_id=f"test_{i}",
                 event_type="test_event",
-                timestamp=datetime.now(),
+                timestamp=FIXED_TS,
                 source_id="source_1",
                 target_id="target_1",
                 data={}
@@ -209,16 +232,18 @@ class TestEventDispatcherAdapter:
         dispatcher.subscribe("test_event", handler)
         
         def dispatch_events():
-            for i in range(100):
-                event = CombatEvent(
+            events = [
+                CombatEvent(
                     event_id=f"test_{i}",
                     event_type="test_event",
-                    timestamp=datetime.now(),
+                    timestamp=FIXED_TS,
                     source_id="source_1",
                     target_id="target_1",
                     data={"count": i}
                 )
-                dispatcher.dispatch(event)
+                for i in range(100)
+            ]
+            dispatcher.dispatch_batch(events)
                 
         # Create multiple dispatch threads
         threads = [Thread(target=dispatch_events) for _ in range(5)]
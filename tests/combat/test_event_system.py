@@ -17,6 +17,9 @@ from combat.lib.event_system import (
 from tests.combat.conftest import PerformanceStats
 from tests.combat.mocks import MockEventDispatcher
 
+# Fixed event time, so tests do not read the clock per event
+FIXED_TS = datetime(2024, 1, 1)
+
 class TestEnhancedEvent:
     """Test suite for enhanced events."""
     
@@ -27,7 +30,7 @@ class TestEnhancedEvent:
             event_type="attack",
             category=EventCategory.COMBAT,
             importance=EventImportance.MAJOR,
-            timestamp=datetime.now(),
+            timestamp=FIXED_TS,
             source_id="attacker_1",
             target_id="defender_1",
             data={"damage": 50, "type": "slash"}
@@ -46,7 +49,7 @@ class TestEnhancedEvent:
             event_type="attack",
             category=EventCategory.COMBAT,
             importance=EventImportance.MAJOR,
-            timestamp=datetime.now(),
+            timestamp=FIXED_TS,
             source_id="attacker_1",
             target_id="defender_1",
             data={"damage": 50, "type": "slash"}
@@ -108,7 +111,7 @@ class TestEventStream:
             event_type="log",
             category=EventCategory.DEBUG,
             importance=EventImportance.MINOR,
-            timestamp=datetime.now(),
+            timestamp=FIXED_TS,
             source_id="system",
             target_id=None,
             data={"message": "test"}
@@ -121,7 +124,7 @@ class TestEventStream:
             event_type="move",
             category=EventCategory.COMBAT,
             importance=EventImportance.DEBUG,
-            timestamp=datetime.now(),
+            timestamp=FIXED_TS,
             source_id="player",
             target_id=None,
             data={"distance": 1}
@@ -137,7 +140,7 @@ class TestEventStream:
                 event_type="attack",
                 category=EventCategory.COMBAT,
                 importance=EventImportance.MAJOR,
-                timestamp=datetime.now(),
+                timestamp=FIXED_TS,
                 source_id="attacker",
                 target_id="defender",
                 data={"index": i}
@@ -151,7 +154,7 @@ class TestEventStream:
 
     def test_time_range_filtering(self, combat_stream):
         """Test event filtering by time range."""
-        base_time = datetime.now()
+        base_time = FIXED_TS
         
         # Add events at different times
         for i in range(5):
@@ -233,6 +236,25 @@ class TestEventManager:
                 100
             )
 
+    def test_custom_category_stream(self, manager):
+        """Test streams for categories outside EventCategory."""
+        manager.create_stream("custom", {"custom"}, EventImportance.MINOR, 100)
+        
+        event = EnhancedEvent(
+            event_id="custom_1",
+            event_type="custom",
+            category="custom",
+            importance=EventImportance.MAJOR,
+            timestamp=FIXED_TS,
+            source_id="system",
+            target_id=None,
+            data={}
+        )
+        manager.dispatch_event(event)
+        
+        assert manager.get_stream("custom").get_events() == [event]
+        assert len(manager.get_stream("combat").get_events()) == 0
+
     def test_event_routing(self, manager):
         """Test event routing to appropriate streams."""
         # Create test event
@@ -241,7 +263,7 @@ class TestEventManager:
             event_type="attack",
             category=EventCategory.COMBAT,
             importance=EventImportance.MAJOR,
-            timestamp=datetime.now(),
+            timestamp=FIXED_TS,
             source_id="attacker",
             target_id="defender",
             data={"damage": 50}
@@ -263,6 +285,29 @@ class TestEventManager:
         # Should not be in animation stream
         assert len(manager.get_stream("animation").get_events()) == 0
 
+    def test_unmapped_category(self, manager):
+        """Test that events with an unknown category reach no streams."""
+        received_events = []
+        manager.subscribe("custom", received_events.append)
+        
+        event = EnhancedEvent(
+            event_id="custom_1",
+            event_type="custom",
+            category="custom",
+            importance=EventImportance.MINOR,
+            timestamp=FIXED_TS,
+            source_id="system",
+            target_id=None,
+            data={}
+        )
+        
+        manager.dispatch_event(event)  # Should not raise
+        
+        # Handlers still run, but no stream stores the event
+        assert received_events == [event]
+        for name in ("combat", "ai_training", "animation"):
+            assert len(manager.get_stream(name).get_events()) == 0
+
     def test_event_handlers(self, manager):
         """Test event handler registration and execution."""
         # Set up test handler
@@ -282,7 +327,7 @@ class TestEventManager:
             event_type="attack",
             category=EventCategory.COMBAT,
             importance=EventImportance.MAJOR,
-            timestamp=datetime.now(),
+            timestamp=FIXED_TS,
             source_id="attacker",
             target_id="defender",
             data={"damage": 50}
@@ -293,7 +338,7 @@ class TestEventManager:
             event_type="move",
             category=EventCategory.MOVEMENT,
             importance=EventImportance.MINOR,
-            timestamp=datetime.now(),
+            timestamp=FIXED_TS,
             source_id="player",
             target_id=None,
             data={"distance": 1}
@@ -328,7 +373,7 @@ class TestEventManager:
             event_type="test",
             category=EventCategory.DEBUG,
             importance=EventImportance.DEBUG,
-            timestamp=datetime.now(),
+            timestamp=FIXED_TS,
             source_id="system",
             target_id=None,
             data={}
@@ -343,7 +388,7 @@ class TestEventManager:
             event_type="test",
             category=EventCategory.COMBAT,
             importance=EventImportance.MAJOR,
-            timestamp=datetime.now(),
+            timestamp=FIXED_TS,
             source_id="test",
             target_id=None,
             data={}
@@ -361,18 +406,20 @@ class TestEventManager:
         """Test event system performance."""
         # Measure event dispatch performance
         start_time = datetime.now()
-        for i in range(1000):
-            event = EnhancedEvent(
+        events = [
+            EnhancedEvent(
                 event_id=f"perf_{i}",
                 event_type="test",
                 category=EventCategory.COMBAT,
                 importance=EventImportance.MINOR,
-                timestamp=datetime.now(),
+                timestamp=FIXED_TS,
                 source_id="test",
                 target_id=None,
                 data={"index": i}
             )
-            manager.dispatch_event(event)
+            for i in range(1000)
+        ]
+        manager.dispatch_batch(events)
         dispatch_time = (datetime.now() - start_time).total_seconds()
         performance_stats.record_operation("event_dispatch", dispatch_time)
         
@@ -387,7 +434,7 @@ class TestEventManager:
         assert dispatch_time < 1.0  # Should handle 1000 events quickly
         assert retrieval_time < 0.1  # Should retrieve events efficiently
         
-        manager.dispatch_event(event)
+        manager.dispatch_event(events[-1])
         assert len(manager.get_stream("combat").get_events()) == 1
         
         manager.clear_stream("combat")
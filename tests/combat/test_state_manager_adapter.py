@@ -6,10 +6,10 @@ and maintains proper state management with validation rules.
 """
 
 import pytest
+from dataclasses import replace
 from combat.adapters import StateManagerAdapter
 from combat.interfaces import CombatantState, Action
 from combat.lib.actions_library import ACTIONS
-from tests.combat.test_combatant_adapter import create_test_combatant
 
 class TestStateManagerAdapter:
     """Test suite for StateManagerAdapter class."""
@@ -43,6 +43,11 @@ class TestStateManagerAdapter:
         """Test getting state for nonexistent entity."""
         assert manager.get_state("nonexistent") is None
 
+    def test_none_state_rejected(self, manager, base_state):
+        """Test that a None state is rejected."""
+        with pytest.raises(ValueError):
+            manager.update_state(base_state.entity_id, None)
+
     def test_initial_state_update(self, manager, base_state):
         """Test initial state update."""
         manager.update_state(base_state.entity_id, base_state)
@@ -54,10 +59,9 @@ class TestStateManagerAdapter:
         manager.update_state(base_state.entity_id, base_state)
         
         # Valid health reduction
-        new_state = CombatantState(
-            **{**base_state.__dict__, 
-               "stats": {**base_state.stats, "health": 80}
-            }
+        new_state = replace(
+            base_state,
+            stats={**base_state.stats, "health": 80}
         )
         manager.update_state(base_state.entity_id, new_state)
         assert manager.get_state(base_state.entity_id).health == 80
@@ -67,10 +71,9 @@ class TestStateManagerAdapter:
         manager.update_state(base_state.entity_id, base_state)
         
         # Health increase without recovery action
-        new_state = CombatantState(
-            **{**base_state.__dict__,
-               "stats": {**base_state.stats, "health": 120}
-            }
+        new_state = replace(
+            base_state,
+            stats={**base_state.stats, "health": 120}
         )
         with pytest.raises(Exception):
             manager.update_state(base_state.entity_id, new_state)
@@ -78,22 +81,20 @@ class TestStateManagerAdapter:
     def test_valid_stamina_recovery(self, manager, base_state):
         """Test valid stamina recovery."""
         # Set initial low stamina
-        initial_state = CombatantState(
-            **{**base_state.__dict__, 
-               "stamina": 50,
-               "stats": {**base_state.stats}
-            }
+        initial_state = replace(
+            base_state,
+            stamina=50,
+            stats={**base_state.stats}
         )
         manager.update_state(base_state.entity_id, initial_state)
         
         # Valid recovery action
-        recovery_state = CombatantState(
-            **{**initial_state.__dict__,
-               "stamina": 60,
-               "stats": {
-                   **initial_state.stats,
-                   "current_action": {"type": "recover", "time": 100}
-               }
+        recovery_state = replace(
+            initial_state,
+            stamina=60,
+            stats={
+                **initial_state.stats,
+                "current_action": {"type": "recover", "time": 100}
             }
         )
         manager.update_state(base_state.entity_id, recovery_state)
@@ -104,24 +105,22 @@ class TestStateManagerAdapter:
         manager.update_state(base_state.entity_id, base_state)
         
         # Can't attack while already attacking
-        attacking_state = CombatantState(
-            **{**base_state.__dict__,
-               "stats": {
-                   **base_state.stats,
-                   "current_action": {"type": "try_attack", "time": 100}
-               }
+        attacking_state = replace(
+            base_state,
+            stats={
+                **base_state.stats,
+                "current_action": {"type": "try_attack", "time": 100}
             }
         )
         manager.update_state(base_state.entity_id, attacking_state)
         
         # Attempt another attack
         with pytest.raises(Exception):
-            new_attack_state = CombatantState(
-                **{**attacking_state.__dict__,
-                   "stats": {
-                       **attacking_state.stats,
-                       "current_action": {"type": "try_attack", "time": 200}
-                   }
+            new_attack_state = replace(
+                attacking_state,
+                stats={
+                    **attacking_state.stats,
+                    "current_action": {"type": "try_attack", "time": 200}
                 }
             )
             manager.update_state(base_state.entity_id, new_attack_state)
@@ -131,21 +130,19 @@ class TestStateManagerAdapter:
         manager.update_state(base_state.entity_id, base_state)
         
         # Can't block with insufficient stamina
-        low_stamina_state = CombatantState(
-            **{**base_state.__dict__, 
-               "stamina": 0,
-               "stats": {**base_state.stats}
-            }
+        low_stamina_state = replace(
+            base_state,
+            stamina=0,
+            stats={**base_state.stats}
         )
         manager.update_state(base_state.entity_id, low_stamina_state)
         
         with pytest.raises(Exception):
-            blocking_state = CombatantState(
-                **{**low_stamina_state.__dict__,
-                   "stats": {
-                       **low_stamina_state.stats,
-                       "current_action": {"type": "blocking", "time": 100}
-                   }
+            blocking_state = replace(
+                low_stamina_state,
+                stats={
+                    **low_stamina_state.stats,
+                    "current_action": {"type": "blocking", "time": 100}
                 }
             )
             manager.update_state(base_state.entity_id, blocking_state)
@@ -155,23 +152,21 @@ class TestStateManagerAdapter:
         manager.update_state(base_state.entity_id, base_state)
         
         # Can't move while blocking
-        blocking_state = CombatantState(
-            **{**base_state.__dict__,
-               "stats": {
-                   **base_state.stats,
-                   "current_action": {"type": "blocking", "time": 100}
-               }
+        blocking_state = replace(
+            base_state,
+            stats={
+                **base_state.stats,
+                "current_action": {"type": "blocking", "time": 100}
             }
         )
         manager.update_state(base_state.entity_id, blocking_state)
         
         with pytest.raises(Exception):
-            movement_state = CombatantState(
-                **{**blocking_state.__dict__,
-                   "stats": {
-                       **blocking_state.stats,
-                       "current_action": {"type": "move_forward", "time": 200}
-                   }
+            movement_state = replace(
+                blocking_state,
+                stats={
+                    **blocking_state.stats,
+                    "current_action": {"type": "move_forward", "time": 200}
                 }
             )
             manager.update_state(base_state.entity_id, movement_state)
@@ -185,10 +180,9 @@ class TestStateManagerAdapter:
         current_health = 100
         for i in range(5):
             current_health -= 20
-            state = CombatantState(
-                **{**base_state.__dict__,
-                   "stats": {**base_state.stats, "health": current_health}
-                }
+            state = replace(
+                base_state,
+                stats={**base_state.stats, "health": current_health}
             )
             states.append(state)
             manager.update_state(base_state.entity_id, state)
@@ -199,15 +193,56 @@ class TestStateManagerAdapter:
         assert history[0].health == 100  # Original state
         assert history[-1].health == 40  # Second to last state
 
+    def test_history_is_bounded(self, manager, base_state):
+        """Test that only the most recent states are kept in history."""
+        manager.MAX_HISTORY = 3
+        manager.update_state(base_state.entity_id, base_state)
+        for health in [90, 80, 70, 60, 50]:
+            state = replace(
+                base_state,
+                stats={**base_state.stats, "health": health}
+            )
+            manager.update_state(base_state.entity_id, state)
+            
+        history = manager.get_state_history(base_state.entity_id)
+        assert [state.stats["health"] for state in history] == [80, 70, 60]
+        assert len(manager.get_state_history(base_state.entity_id, limit=2)) == 2
+
+    def test_unchanged_state_skips_history(self, manager, base_state):
+        """Test that re-applying an equal state is a no-op."""
+        manager.update_state(base_state.entity_id, base_state)
+        manager.update_state(base_state.entity_id, replace(base_state))
+        
+        assert manager.get_state_history(base_state.entity_id) == []
+
+    def test_same_object_update_records_history(self, manager, base_state):
+        """Test that re-applying the stored state object records history."""
+        state = replace(base_state, stats=dict(base_state.stats))
+        manager.update_state(state.entity_id, state)
+        state.stats["health"] -= 10
+        manager.update_state(state.entity_id, state)
+        
+        assert len(manager.get_state_history(state.entity_id)) == 1
+
+    def test_batch_update_keeps_last_state(self, manager, base_state):
+        """Test that a batch update records one history entry per entity."""
+        manager.update_state(base_state.entity_id, base_state)
+        manager.update_state_batch(
+            replace(base_state, stats={**base_state.stats, "health": health})
+            for health in [90, 80, 70]
+        )
+        
+        assert manager.get_state(base_state.entity_id).stats["health"] == 70
+        assert len(manager.get_state_history(base_state.entity_id)) == 1
+
     def test_state_rollback(self, manager, base_state):
         """Test state rollback functionality."""
         manager.update_state(base_state.entity_id, base_state)
         
         # Create a new state
-        new_state = CombatantState(
-            **{**base_state.__dict__,
-               "stats": {**base_state.stats, "health": 80}
-            }
+        new_state = replace(
+            base_state,
+            stats={**base_state.stats, "health": 80}
         )
         manager.update_state(base_state.entity_id, new_state)
         
@@ -222,10 +257,9 @@ class TestStateManagerAdapter:
         
         # Create some history
         for health in [80, 60, 40]:
-            state = CombatantState(
-                **{**base_state.__dict__,
-                   "stats": {**base_state.stats, "health": health}
-                }
+            state = replace(
+                base_state,
+                stats={**base_state.stats, "health": health}
             )
             manager.update_state(base_state.entity_id, state)
             
@@ -239,17 +273,15 @@ class TestStateManagerAdapter:
         entity1_id = "entity1"
         entity2_id = "entity2"
         
-        state1 = CombatantState(
-            **{**base_state.__dict__,
-               "entity_id": entity1_id,
-               "stats": {**base_state.stats}
-            }
+        state1 = replace(
+            base_state,
+            entity_id=entity1_id,
+            stats={**base_state.stats}
         )
-        state2 = CombatantState(
-            **{**base_state.__dict__,
-               "entity_id": entity2_id,
-               "stats": {**base_state.stats}
-            }
+        state2 = replace(
+            base_state,
+            entity_id=entity2_id,
+            stats={**base_state.stats}
         )
         
         # Update both entities
@@ -257,10 +289,9 @@ class TestStateManagerAdapter:
         manager.update_state(entity2_id, state2)
         
         # Modify one entity
-        new_state1 = CombatantState(
-            **{**state1.__dict__,
-               "stats": {**state1.stats, "health": 80}
-            }
+        new_state1 = replace(
+            state1,
+            stats={**state1.stats, "health": 80}
         )
         manager.update_state(entity1_id, new_state1)
         